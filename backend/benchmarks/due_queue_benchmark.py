@@ -0,0 +1,85 @@
+"""Cost of picking the next questions to practise as answer history grows.
+
+    python benchmarks/due_queue_benchmark.py --questions 5000 --answers 0 5 20
+
+For each answers-per-question count a scratch SQLite database is filled with
+questions over 10 courses and that many answers per question, and the review
+schedules are rebuilt with rebuild_question_reviews(). The script then times
+GET /api/practice/due for one course, POST /api/save_user_answer, and the old
+way of choosing: GET /api/get_saved_questions for the course with every answer,
+leaving the scheduling to the client.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, UTC
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def timed(call, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = call()
+        timings.append(1000 * (time.perf_counter() - started))
+        assert response.status_code < 300, response.get_json()
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Due queue benchmark")
+    parser.add_argument("--questions", type=int, default=5000)
+    parser.add_argument("--answers", type=int, nargs="+", default=[0, 5, 20])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp.name, 'due.db')}"
+    os.environ.setdefault("LOG_LEVEL", "OFF")
+
+    from sqlalchemy import insert
+
+    from app import Course, GeneratedQuestion, UserAnswer, app, db, rebuild_question_reviews
+
+    client = app.test_client()
+    rng = random.Random(5)
+    print(f"{args.questions} questions over 10 courses; median ms of {args.repeat} calls")
+    print(f"{'answers/q':>9s} {'due page':>9s} {'answer':>9s} {'all saved':>10s}")
+    for per_question in args.answers:
+        with app.app_context():
+            db.drop_all()
+            db.create_all()
+            db.session.execute(insert(Course), [
+                {"code": f"BEN{i:03d}", "name": "Benchmarking", "year": 2024, "semester": "Semester 1"} for i in range(10)
+            ])
+            start = datetime.now(UTC) - timedelta(days=90)
+            db.session.execute(insert(GeneratedQuestion), [{
+                "course_id": 1 + i % 10, "question_type": "free_text", "question_text": f"Question {i}?",
+                "correct_answer": "-", "generated_at": start
+            } for i in range(args.questions)])
+            answers = [{
+                "question_id": question_id, "user_input": "-", "is_correct": rng.random() < 0.7,
+                "answered_at": start + timedelta(days=n * 90 / (per_question + 1))
+            } for question_id in range(1, args.questions + 1) for n in range(1, per_question + 1)]
+            for offset in range(0, len(answers), 50000):
+                db.session.execute(insert(UserAnswer), answers[offset:offset + 50000])
+            rebuild_question_reviews()
+            db.session.commit()
+
+        due_ms = timed(lambda: client.get("/api/practice/due", query_string={"course_id": 1, "limit": 10}), args.repeat)
+        answer_ms = timed(lambda: client.post("/api/save_user_answer", json={
+            "question_id": rng.randint(1, args.questions), "user_input": "-", "is_correct": rng.random() < 0.7
+        }), args.repeat)
+        saved_ms = timed(lambda: client.get("/api/get_saved_questions", query_string={"course_id": 1}),
+                         max(3, args.repeat // 5))
+        print(f"{per_question:9d} {due_ms:9.2f} {answer_ms:9.2f} {saved_ms:10.1f}")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare the plain OpenAI SDK client with ManagedLlmClient against a flaky and a failing upstream.
+
+    python tools/fake_xai_server.py --port 8765 --latency 0.2
+    python benchmarks/llm_client_benchmark.py --base-url http://127.0.0.1:8765/v1
+
+Reconfigures the fake server through /fake/config for each phase:
+
+* flaky: a share of the completions fail with 429/503 (--error-rate);
+* outage: every completion fails with 503.
+
+Each phase sends --calls completions from --callers threads through each client
+and reports successes, latency percentiles, and how many requests reached the
+upstream. The SDK client uses its defaults (two retries, 10 minute timeout);
+the managed client uses the XAI_* settings from llm_client.py. The fake server
+is set back to error-free at the end.
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx
+from openai import OpenAI
+
+from llm_client import ManagedLlmClient
+
+MESSAGES = [{"role": "user", "content": "Generate 3 flashcard items."}]
+
+
+def fake_server(base_url, path, config=None):
+    url = base_url.rsplit("/v1", 1)[0] + path
+    data = json.dumps(config).encode("utf-8") if config is not None else None
+    with urllib.request.urlopen(urllib.request.Request(url, data=data, method="POST" if data else "GET")) as response:
+        return json.loads(response.read())
+
+
+def run_phase(call, calls, callers):
+    def timed(_):
+        started = time.perf_counter()
+        try:
+            call()
+            ok = True
+        except Exception:
+            ok = False
+        return ok, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        results = list(pool.map(timed, range(calls)))
+    latencies = sorted(elapsed for _, elapsed in results)
+    return sum(ok for ok, _ in results), latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM client benchmark")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8765/v1")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--error-rate", type=float, default=0.3)
+    args = parser.parse_args()
+    logging.getLogger("augmented.llm").setLevel(logging.ERROR)  # one warning per retry otherwise
+
+    sdk = OpenAI(api_key="benchmark", base_url=args.base_url, http_client=httpx.Client(trust_env=False))
+    phases = [
+        ("flaky", {"error_rate": args.error_rate, "error_status": [429, 503], "retry_after": None}),
+        ("outage", {"error_rate": 1.0, "error_status": [503], "retry_after": None}),
+    ]
+    print(f"{args.calls} calls from {args.callers} threads per run")
+    print(f"{'phase':8s} {'client':8s} {'ok':>5s} {'p50 s':>7s} {'p95 s':>7s} {'max s':>7s} {'upstream':>9s}")
+    try:
+        for phase, config in phases:
+            # A fresh managed client per phase, so the outage run starts with a closed circuit
+            managed = ManagedLlmClient(api_key="benchmark", base_url=args.base_url)
+            clients = [
+                ("sdk", lambda: sdk.chat.completions.create(model="grok-3", messages=MESSAGES)),
+                ("managed", lambda: managed.complete(model="grok-3", messages=MESSAGES)),
+            ]
+            fake_server(args.base_url, "/fake/config", config)
+            for name, call in clients:
+                before = fake_server(args.base_url, "/fake/stats")["requests"]
+                ok, latencies = run_phase(call, args.calls, args.callers)
+                upstream = fake_server(args.base_url, "/fake/stats")["requests"] - before
+                p95 = latencies[int(len(latencies) * 0.95) - 1]
+                print(f"{phase:8s} {name:8s} {ok:5d} {statistics.median(latencies):7.2f} {p95:7.2f} "
+                      f"{latencies[-1]:7.2f} {upstream:9d}")
+            managed.http_client.close()
+    finally:
+        fake_server(args.base_url, "/fake/config", {"error_rate": 0.0})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Near-duplicate checks against a growing question bank: LSH bucket lookup vs a linear scan.
+
+    python benchmarks/near_duplicate_benchmark.py --sizes 1000 10000 50000
+
+For each bank size a scratch SQLite database is filled with synthetic questions
+for one course and indexed with rebuild_question_index(). A batch of new items
+is then checked, half of them light edits of saved questions (a changed word
+or punctuation) and half fresh. The check runs two ways: saved_near_duplicates()
+as save_practice_items calls it, and a linear scan that computes the Jaccard
+similarity against every saved question of the course. The script reports the
+time per batch, how many saved questions each method compared, and the recall
+of the LSH lookup against the exact scan.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+STEMS = ["What is", "Explain", "Describe", "Compare", "Why does", "How would you measure", "Define", "Derive"]
+SYLLABLES = ["ka", "lo", "mi", "ren", "sta", "vor", "qui", "ber", "tal", "zen", "dro", "pha", "nu", "gex", "wim"]
+
+
+def word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def question(rng):
+    return f"{rng.choice(STEMS)} the {word(rng)} {word(rng)} of {word(rng)} in a {word(rng)} {word(rng)} {word(rng)}?"
+
+
+def light_edit(rng, text):
+    # Swap one word for a made-up one, or just change the punctuation and case
+    words = text.rstrip("?").split()
+    if rng.random() < 0.5:
+        return " ".join(words).upper() + "."
+    words[rng.randrange(len(words))] = word(rng)
+    return " ".join(words) + "?"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate index benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp.name, 'questions.db')}"
+    os.environ.setdefault("LOG_LEVEL", "OFF")
+
+    from sqlalchemy import distinct, func, insert, select
+
+    from app import (NEAR_DUPLICATE_THRESHOLD, Course, GeneratedQuestion, QuestionLshBucket, app, db,
+                     rebuild_question_index, saved_near_duplicates)
+    from near_duplicates import jaccard, text_signature
+
+    print(f"threshold {NEAR_DUPLICATE_THRESHOLD}, {args.batch} new items per batch (half edited copies)")
+    print(f"{'bank':>7s} {'method':7s} {'ms':>9s} {'compared':>9s} {'flagged':>8s} {'recall':>7s}")
+    rng = random.Random(7)
+    with app.app_context():
+        for size in args.sizes:
+            db.drop_all()
+            db.create_all()
+            course = Course(code="BEN101.1", name="Benchmarking", year=2024, semester="Semester 1")
+            db.session.add(course)
+            db.session.flush()
+            texts = [question(rng) for _ in range(size)]
+            db.session.execute(insert(GeneratedQuestion), [
+                {"course_id": course.id, "question_type": "free_text", "question_text": text, "correct_answer": "-"}
+                for text in texts
+            ])
+            rebuild_question_index()
+            db.session.commit()
+
+            batch = [light_edit(rng, rng.choice(texts)) for _ in range(args.batch // 2)]
+            batch += [question(rng) for _ in range(args.batch - len(batch))]
+            signatures = [text_signature(text) for text in batch]
+
+            started = time.perf_counter()
+            scan = db.session.execute(
+                select(GeneratedQuestion.question_text).where(GeneratedQuestion.course_id == course.id)
+            ).scalars().all()
+            saved = [text_signature(text)[0] for text in scan]
+            exact = [any(jaccard(shingle_set, other) >= NEAR_DUPLICATE_THRESHOLD for other in saved)
+                     for shingle_set, _ in signatures]
+            scan_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            found = saved_near_duplicates(course.id, signatures)
+            lsh_ms = (time.perf_counter() - started) * 1000
+            # Saved questions sharing a bucket with the batch, i.e. the ones the lookup compared
+            compared = db.session.scalar(
+                select(func.count(distinct(QuestionLshBucket.question_id))).where(
+                    QuestionLshBucket.course_id == course.id,
+                    QuestionLshBucket.bucket.in_({bucket for _, buckets in signatures for bucket in buckets})
+                )
+            )
+
+            flagged = [match is not None for match in found]
+            recall = sum(f and e for f, e in zip(flagged, exact)) / max(sum(exact), 1)
+            print(f"{size:7d} {'scan':7s} {scan_ms:9.1f} {len(scan):9d} {sum(exact):8d} {'':>7s}")
+            print(f"{size:7d} {'lsh':7s} {lsh_ms:9.1f} {compared:9d} {sum(flagged):8d} {recall:7.2f}")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare the legacy page loop with the shared PDF extraction engine.
+
+    python benchmarks/pdf_extract_benchmark.py --pages 300 --repeat 3
+
+Builds a synthetic text-heavy PDF and times:
+  * legacy   - load_page/get_text with full_text += ... (the old request-thread loop)
+  * serial   - extract_pdf_text on the calling thread
+  * parallel - extract_pdf_text across the process pool
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import fitz  # PyMuPDF
+
+from pdf_extract import PDF_EXTRACT_WORKERS, extract_pdf_text, get_pool
+
+
+def synthetic_pdf(num_pages, lines_per_page=60):
+    doc = fitz.open()
+    for page_num in range(num_pages):
+        page = doc.new_page()
+        text = "\n".join(
+            f"Lecture {page_num + 1}, line {line}: gradient descent updates weights by the negative gradient."
+            for line in range(lines_per_page)
+        )
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), text, fontsize=8)
+    return doc.tobytes()
+
+
+def legacy_extract(pdf_bytes):
+    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+    full_text = ""
+    for page_num in range(pdf_document.page_count):
+        page = pdf_document.load_page(page_num)
+        full_text += page.get_text()
+    return full_text
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF extraction benchmark")
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pdf_bytes = synthetic_pdf(args.pages)
+    print(f"{args.pages} pages, {len(pdf_bytes) / 1024:.0f} KB, {PDF_EXTRACT_WORKERS} workers")
+
+    get_pool().submit(int).result()  # start the pool outside the timed runs
+    legacy_time, legacy_text = best_of(args.repeat, lambda: legacy_extract(pdf_bytes))
+    serial_time, serial = best_of(args.repeat, lambda: extract_pdf_text(pdf_bytes, parallel=False))
+    parallel_time, parallel = best_of(args.repeat, lambda: extract_pdf_text(pdf_bytes, parallel=True))
+    assert legacy_text == serial.text == parallel.text, "engines disagree on extracted text"
+
+    for name, seconds in (("legacy", legacy_time), ("serial", serial_time), ("parallel", parallel_time)):
+        print(f"{name:>9}: {seconds * 1000:8.1f} ms  ({args.pages / seconds:8.0f} pages/s, {legacy_time / seconds:5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time /api/generate_practice for growing practice sets, as one completion and split into chunks.
+
+    python tools/fake_xai_server.py --port 8765 --latency 0.3 --token-latency 0.005
+    python benchmarks/practice_fanout_benchmark.py --base-url http://127.0.0.1:8765/v1
+
+--token-latency makes the fake server's response time grow with the length of
+the completion, like a real model. The app runs on a scratch SQLite database.
+For each set size the route is called once with PRACTICE_CHUNK_ITEMS raised
+past the set size (a single completion) and once with the configured chunk size.
+It reports wall time, saved items and the INSERT statements issued for them.
+SQLite can't return ids in parameter order from a batched INSERT, so SQLAlchemy
+sends one statement per row there; PostgreSQL gets a single statement.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Practice fan-out benchmark")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8765/v1")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 25, 50, 100])
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp.name, 'practice.db')}"
+    os.environ["XAI_BASE_URL"] = args.base_url
+    os.environ.setdefault("XAI_API_KEY", "benchmark")
+    os.environ.setdefault("LOG_LEVEL", "OFF")
+
+    from sqlalchemy import event
+
+    import app as app_module
+    from app import Course, app, db
+
+    inserts = []
+    with app.app_context():
+        db.create_all()
+        db.session.add(Course(code="BEN101.1", name="Benchmarking", year=2024, semester="Semester 1"))
+        db.session.commit()
+        course_id = db.session.query(Course.id).scalar()
+
+        @event.listens_for(db.engine, "before_cursor_execute")
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO generated_question"):
+                inserts.append(statement)
+
+    chunk_items = app_module.PRACTICE_CHUNK_ITEMS
+    app_module.MAX_PRACTICE_ITEMS = max(args.sizes)
+    client = app.test_client()
+    print(f"chunks of up to {chunk_items} items")
+    print(f"{'items':>5s} {'mode':8s} {'seconds':>8s} {'saved':>6s} {'inserts':>8s}")
+    for size in args.sizes:
+        for mode, chunk_size in (("single", max(args.sizes) + 1), ("chunked", chunk_items)):
+            app_module.PRACTICE_CHUNK_ITEMS = chunk_size
+            inserts.clear()
+            started = time.perf_counter()
+            response = client.post("/api/generate_practice", json={
+                "course_id": course_id, "type": "flashcard", "question_type": "free_text",
+                "num_items": size, "bypass_cache": True
+            })
+            elapsed = time.perf_counter() - started
+            saved = sum("id" in item for item in response.get_json()["items"])
+            print(f"{size:5d} {mode:8s} {elapsed:8.2f} {saved:6d} {len(inserts):8d}")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Cold-start benchmark: import time of app.py and time to its first request.
+
+    python benchmarks/startup_benchmark.py --runs 5
+    python benchmarks/startup_benchmark.py --runs 5 --eager
+
+Each run is a fresh interpreter, like a new gunicorn worker. It imports app,
+creates the tables in a scratch SQLite database (not timed), then times a
+first GET /api/courses through the test client. --eager imports the OpenAI SDK,
+httpx, NumPy and PyMuPDF before app, which is what every worker paid before
+those imports were deferred. Also reports which of them the run ended up loading.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+HEAVY_MODULES = ("openai", "httpx", "numpy", "fitz")
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+if {eager}:
+    import fitz, httpx, numpy, openai
+import app
+imported = time.perf_counter()
+with app.app.app_context():
+    app.db.create_all()
+client = app.app.test_client()
+request_started = time.perf_counter()
+status = client.get("/api/courses").status_code
+finished = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "first_request_ms": (finished - request_started) * 1000,
+    "status": status,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def run_once(eager, database_url):
+    env = dict(os.environ, DATABASE_URL=database_url, LOG_LEVEL="OFF")
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(eager=eager, heavy=HEAVY_MODULES)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="pre-import the heavy dependencies")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        results = [run_once(args.eager, database_url) for _ in range(args.runs)]
+
+    import_ms = [r["import_ms"] for r in results]
+    request_ms = [r["first_request_ms"] for r in results]
+    print(f"{'eager' if args.eager else 'lazy'} imports, {args.runs} runs (median / min)")
+    print(f"  import app:     {statistics.median(import_ms):7.1f} ms / {min(import_ms):7.1f} ms")
+    print(f"  first request:  {statistics.median(request_ms):7.1f} ms / {min(request_ms):7.1f} ms")
+    print(f"  heavy modules loaded: {', '.join(results[-1]['loaded']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
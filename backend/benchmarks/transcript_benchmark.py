@@ -0,0 +1,91 @@
+"""Throughput benchmark for the transcript parser.
+
+    python benchmarks/transcript_benchmark.py --pages 10 --repeat 200
+
+Generates synthetic transcript page text (no PDF needed) and reports lines/sec
+and milliseconds per transcript for parse_transcript, next to the previous
+list-building, fixed-offset parser loop for reference.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from transcript_parser import DEFAULT_LAYOUT, parse_transcript
+
+GRADES = ["High Distinction", "Distinction", "Credit", "Pass", "Fail", "Enrolled"]
+
+
+def generate_synthetic_transcript(pages=10, units_per_page=12, seed=0):
+    """Page texts laid out like the default transcript: semester header, then code/name/credit points/grade."""
+    rng = random.Random(seed)
+    page_texts = []
+    for page_num in range(pages):
+        term = "Summer" if page_num % 3 == 2 else str(1 + page_num % 3 % 2)
+        lines = ["Statement of Academic Record", f"Page {page_num + 1} of {pages}",
+                 f"Semester {term}, {2018 + page_num // 3}"]
+        for _ in range(units_per_page):
+            letters = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(3))
+            lines += [f"{letters}{rng.randint(100, 999)}.{rng.randint(1, 9)}",
+                      f"Introduction to {letters.title()} Studies", "12", rng.choice(GRADES)]
+        page_texts.append("\n".join(lines) + "\n")
+    return page_texts
+
+
+def legacy_parse(full_text):
+    # The parser loop previously inlined in upload_transcript, minus its print calls
+    lines = [line.strip() for line in full_text.split('\n') if line.strip()]
+    semester_regex = re.compile(r"Semester (\d|Summer), (\d{4})")
+    unit_code_regex = re.compile(r"^[A-Z]{3}\d{3}\.\d$")
+    grade_mapping = DEFAULT_LAYOUT.grade_mapping
+    courses, current_semester, i = [], None, 0
+    while i < len(lines):
+        line = lines[i]
+        semester_match = semester_regex.match(line)
+        if semester_match:
+            current_semester = f"{semester_match.group(1)}, {semester_match.group(2)}"
+            i += 1
+            continue
+        if unit_code_regex.match(line):
+            name = lines[i + 1].strip() if i + 1 < len(lines) else "TBD"
+            grade = grade_mapping.get(lines[i + 3].strip()) if i + 3 < len(lines) else None
+            courses.append((current_semester, line, name, grade))
+            i += 4
+            continue
+        i += 1
+    return courses
+
+
+def time_per_run(repeat, fn):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcript parser benchmark")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--units-per-page", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    pages = generate_synthetic_transcript(args.pages, args.units_per_page)
+    full_text = "".join(pages)
+    num_lines = sum(1 for line in full_text.split("\n") if line.strip())
+
+    engine_time, courses = time_per_run(args.repeat, lambda: parse_transcript(pages))
+    legacy_time, legacy_courses = time_per_run(args.repeat, lambda: legacy_parse(full_text))
+    assert len(courses) == len(legacy_courses), "parsers disagree on the number of units"
+
+    print(f"{args.pages} pages, {num_lines} lines, {len(courses)} units")
+    for name, seconds in (("engine", engine_time), ("legacy", legacy_time)):
+        print(f"{name:>7}: {seconds * 1000:7.3f} ms/transcript  {num_lines / seconds:12.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+NUM_BINS = 13
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def course_set_digest(courses):
+    # Order-independent hash of the graded course set: (grade, year, semester) tuples
+    rows = sorted((int(c.grade), int(c.year), str(c.semester)) for c in courses)
+    return hashlib.sha256(json.dumps(rows).encode('utf-8')).hexdigest()
+
+
+def semester_trend(courses):
+    # Mean grade per semester, ordered the same way as the frontend ("year-semester" string sort)
+    grouped = {}
+    for c in courses:
+        grouped.setdefault(f"{c.year}-{c.semester}", []).append(c.grade)
+    keys = sorted(grouped)
+    semester_gpas = np.array([np.mean(grouped[k]) for k in keys], dtype=float)
+    slope, intercept = fit_trend(semester_gpas)
+    return keys, semester_gpas, slope, intercept
+
+
+def fit_trend(semester_gpas):
+    # Least-squares line through (index, gpa); a single semester gives a flat line
+    semester_gpas = np.asarray(semester_gpas, dtype=float)
+    if len(semester_gpas) > 1:
+        slope, intercept = np.polyfit(np.arange(len(semester_gpas)), semester_gpas, 1)
+    else:
+        slope, intercept = 0.0, float(semester_gpas[0]) if len(semester_gpas) else 0.0
+    return float(slope), float(intercept)
+
+
+def simulate_forecast(courses, total_units, simulations, seed=None):
+    """Run the baseline and optimistic Monte Carlo forecasts as batched array operations.
+
+    Each simulation draws one grade per remaining unit from the empirical grade
+    distribution. The optimistic run adds a log-tempered trendline improvement per
+    future unit, capped at 7.
+    """
+    grades = np.array([c.grade for c in courses], dtype=np.int64)
+    completed_units = len(grades)
+    remaining_units = total_units - completed_units
+    result = {
+        "simulations": simulations,
+        "seed": seed,
+        "completed_units": completed_units,
+        "remaining_units": max(remaining_units, 0),
+        "total_degree_units": total_units,
+        "labels": [],
+        "bin_edges": [],
+        "baseline": [],
+        "optimistic": [],
+        "percentiles": {"baseline": {}, "optimistic": {}},
+    }
+    if completed_units == 0 or remaining_units <= 0:
+        return result
+
+    values, counts = np.unique(grades, return_counts=True)
+    cumulative = np.cumsum(counts) / completed_units
+    current_grade_sum = grades.sum()
+
+    # Improvement per future unit is the same for every simulation, so compute it once
+    keys, semester_gpas, slope, intercept = semester_trend(courses)
+    future_index = len(keys) + np.arange(remaining_units)
+    predicted = slope * future_index + intercept
+    with np.errstate(invalid='ignore'):
+        improvement = np.log1p(predicted - semester_gpas.mean()) * 0.5
+    improvement = np.where(np.isnan(improvement) | (improvement <= 0), 0.0, improvement)
+
+    rng = np.random.default_rng(seed)
+    shape = (simulations, remaining_units)
+    # Inverse-CDF sampling; clip guards against float round-off in the last cumulative bucket
+    baseline_draws = values[np.minimum(np.searchsorted(cumulative, rng.random(shape)), len(values) - 1)]
+    optimistic_draws = values[np.minimum(np.searchsorted(cumulative, rng.random(shape)), len(values) - 1)]
+
+    baseline = (current_grade_sum + baseline_draws.sum(axis=1)) / total_units
+    optimistic_units = np.minimum(optimistic_draws + improvement, 7.0)
+    optimistic = (current_grade_sum + optimistic_units.sum(axis=1)) / total_units
+
+    # Shared bins across both series: width (max - min) / 11, at least 0.02, 13 bins
+    min_gpa = float(min(baseline.min(), optimistic.min()))
+    max_gpa = float(max(baseline.max(), optimistic.max()))
+    bin_width = max((max_gpa - min_gpa) / 11, 0.02)
+    edges = min_gpa + bin_width * np.arange(NUM_BINS + 1)
+
+    def bin_counts(samples):
+        index = np.floor((samples - min_gpa) / bin_width).astype(np.int64)
+        index = index[(index >= 0) & (index < NUM_BINS)]
+        return np.bincount(index, minlength=NUM_BINS).tolist()
+
+    def percentiles(samples):
+        return {f"p{p}": round(float(v), 4) for p, v in zip(PERCENTILES, np.percentile(samples, PERCENTILES))}
+
+    result.update({
+        "labels": [f"{start:.2f}-{start + bin_width - 0.01:.2f}" for start in edges[:-1]],
+        "bin_edges": [round(float(e), 4) for e in edges],
+        "baseline": bin_counts(baseline),
+        "optimistic": bin_counts(optimistic),
+        "percentiles": {"baseline": percentiles(baseline), "optimistic": percentiles(optimistic)},
+    })
+    return result
+
+
+class ForecastCache:
+    # Small LRU keyed on (course set digest, simulations, seed)
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+MIN_GRADE = 3
+MAX_GRADE = 7
+
+
+def convolution_power(pmf, n):
+    # PMF of the sum of n iid draws, by repeated squaring: O(log n) convolutions
+    result = np.ones(1)
+    base = np.asarray(pmf, dtype=float)
+    while n > 0:
+        if n & 1:
+            result = np.convolve(result, base)
+        n >>= 1
+        if n:
+            base = np.convolve(base, base)
+    return result
+
+
+class OutcomeDistribution:
+    """Exact final-GPA distribution for the remaining units.
+
+    Each remaining unit is an independent draw from the empirical 3-7 grade
+    distribution of the graded courses, so the sum of future grade points has
+    PMF ``pmf ** n`` under convolution. Queries against it are array lookups.
+    """
+
+    def __init__(self, courses, total_units):
+        # Grades off the 3-7 scale are left out of the completed units and grade sum as well
+        # as the PMF, so all three describe the same courses
+        grades = np.array([c.grade for c in courses], dtype=np.int64)
+        grades = grades[(grades >= MIN_GRADE) & (grades <= MAX_GRADE)]
+        self.total_units = total_units
+        self.completed_units = len(grades)
+        self.remaining_units = max(total_units - self.completed_units, 0)
+        # Units the final GPA averages over: more than the degree total if more were completed
+        self.gpa_units = self.completed_units + self.remaining_units
+        self.current_grade_sum = int(grades.sum())
+
+        counts = np.bincount(grades - MIN_GRADE, minlength=MAX_GRADE - MIN_GRADE + 1)
+        self.grade_pmf = counts / self.completed_units if self.completed_units else counts.astype(float)
+
+        if self.remaining_units and self.completed_units:
+            # sum_pmf[k] = P(future grade points == MIN_GRADE * remaining + k)
+            self.sum_pmf = convolution_power(self.grade_pmf, self.remaining_units)
+        else:
+            # Nothing to draw from (callers should check completed_units) or nothing left to draw
+            self.sum_pmf = np.ones(1)
+        self.min_future_points = MIN_GRADE * self.remaining_units if self.completed_units else 0
+        # survival[k] = P(future points >= min_future_points + k), with a trailing 0
+        self.survival = np.append(np.cumsum(self.sum_pmf[::-1])[::-1], 0.0)
+
+    @property
+    def final_gpas(self):
+        points = self.current_grade_sum + self.min_future_points + np.arange(len(self.sum_pmf))
+        return points / self.gpa_units
+
+    def expected_gpa(self):
+        return float(np.dot(self.final_gpas, self.sum_pmf))
+
+    def probability_at_least(self, targets):
+        # P(final GPA >= target) for every target at once
+        targets = np.asarray(targets, dtype=float)
+        needed = np.ceil(targets * self.gpa_units - self.current_grade_sum - self.min_future_points - 1e-9)
+        index = np.clip(needed, 0, len(self.survival) - 1).astype(np.int64)
+        return self.survival[index]
+
+    def required_average(self, targets):
+        # Mean grade needed over the remaining units to finish on exactly the target GPA
+        targets = np.asarray(targets, dtype=float)
+        if not self.remaining_units:
+            return np.full(targets.shape, np.nan)
+        return (targets * self.gpa_units - self.current_grade_sum) / self.remaining_units
+
+    def scenarios(self, targets):
+        targets = np.asarray(targets, dtype=float)
+        probabilities = self.probability_at_least(targets)
+        required = self.required_average(targets)
+        current_gpa = self.current_grade_sum / self.completed_units if self.completed_units else 0.0
+        results = []
+        for t, r, p in zip(targets, required, probabilities):
+            if np.isnan(r):
+                achievable = secured = current_gpa >= t
+            else:
+                # Achievable/secured are about the grade scale; probability is about the empirical distribution
+                achievable, secured = r <= MAX_GRADE, r <= MIN_GRADE
+            results.append({
+                "target_gpa": float(t),
+                "required_average": None if np.isnan(r) else round(float(r), 4),
+                "achievable": bool(achievable),
+                "already_secured": bool(secured),
+                "probability": round(float(p), 6),
+            })
+        return results
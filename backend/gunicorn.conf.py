@@ -0,0 +1,38 @@
+"""Gunicorn settings for the backend; picked up automatically from this directory.
+
+    gunicorn app:app
+
+Requests mostly wait on the xAI API (seconds, sometimes a long SSE stream),
+with occasional CPU-heavy PDF extraction that already fans out to its own
+process pool. So: one gthread worker per CPU for CPU work and crash isolation,
+and several threads per worker to keep slow LLM calls from blocking other
+requests. Every GUNICORN_* value can be overridden from the environment.
+
+Database connections: each worker opens up to DB_POOL_SIZE + DB_MAX_OVERFLOW
+connections (see app.engine_options). Keep that at or above threads plus
+LLM_JOB_CONCURRENCY, and workers x (pool size + overflow) below the
+Postgres max_connections.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+
+# gthread workers heartbeat from their main thread, so this only kills hung
+# workers; long LLM calls and SSE streams on request threads are not cut off
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Recycle workers now and then to return memory held by PDF parsing
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+# Import the app in each worker, not the master: engine pools, the job thread pool
+# and the PDF process pool must not be shared across a fork
+preload_app = False
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
@@ -0,0 +1,56 @@
+import json
+
+
+class JsonArrayItemParser:
+    """Incrementally pulls complete objects out of a JSON array as text arrives.
+
+    Feed it chunks of a streamed completion such as '[{"question": ...}, {...}]###'.
+    Each call returns the objects that were completed by that chunk. Text before
+    the opening '[' and after the closing ']' is ignored. Only the current,
+    still-open object is buffered.
+    """
+
+    def __init__(self):
+        self.started = False  # seen the opening '['
+        self.finished = False  # seen the closing ']'
+        self._buffer = []
+        self._depth = 0  # nesting depth inside the array; 0 means between items
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text):
+        items = []
+        for ch in text:
+            if self.finished:
+                break
+            if not self.started:
+                if ch == '[':
+                    self.started = True
+                continue
+            if self._depth == 0:
+                # Between items: skip commas and whitespace until the next object or the end
+                if ch == '{':
+                    self._buffer = [ch]
+                    self._depth = 1
+                elif ch == ']':
+                    self.finished = True
+                continue
+
+            self._buffer.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    items.append(json.loads(''.join(self._buffer)))
+                    self._buffer = []
+        return items
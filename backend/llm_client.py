@@ -0,0 +1,254 @@
+"""Managed client for the xAI (OpenAI-compatible) chat completions API.
+
+One ManagedLlmClient per process wraps the OpenAI SDK with:
+
+* a bounded httpx connection pool with keep-alive, over HTTP/2 when the h2
+  package is installed;
+* a deadline per call that covers waiting for a slot, every attempt and the
+  backoff between attempts;
+* retries with full-jitter exponential backoff on 429, 5xx, timeouts and
+  connection errors, honouring Retry-After (the SDK's own retries are off);
+* a semaphore capping the calls in flight in this process;
+* a circuit breaker that rejects calls at once after repeated upstream
+  failures, and lets a single probe through after the reset timeout.
+
+Rejected calls raise LlmUnavailableError without touching the network. The
+OpenAI SDK and httpx are imported when the first client is built.
+"""
+import importlib.util
+import logging
+import os
+import random
+import threading
+import time
+
+logger = logging.getLogger("augmented.llm")
+
+XAI_MAX_CONNECTIONS = int(os.getenv("XAI_MAX_CONNECTIONS", 20))
+XAI_MAX_KEEPALIVE = int(os.getenv("XAI_MAX_KEEPALIVE", 10))
+XAI_KEEPALIVE_EXPIRY = float(os.getenv("XAI_KEEPALIVE_EXPIRY", 30))
+XAI_HTTP2 = os.getenv("XAI_HTTP2", "true").lower() in ("1", "true", "yes")
+XAI_CONNECT_TIMEOUT = float(os.getenv("XAI_CONNECT_TIMEOUT", 5))
+# Longest wait for response headers or for the next streamed chunk
+XAI_READ_TIMEOUT = float(os.getenv("XAI_READ_TIMEOUT", 60))
+# Keep under the gunicorn timeout so a slow provider can't get the worker killed
+XAI_DEADLINE_SECONDS = float(os.getenv("XAI_DEADLINE_SECONDS", 90))
+XAI_MAX_RETRIES = int(os.getenv("XAI_MAX_RETRIES", 3))
+XAI_RETRY_BASE_DELAY = float(os.getenv("XAI_RETRY_BASE_DELAY", 0.5))
+XAI_RETRY_MAX_DELAY = float(os.getenv("XAI_RETRY_MAX_DELAY", 8))
+XAI_MAX_IN_FLIGHT = int(os.getenv("XAI_MAX_IN_FLIGHT", 8))
+XAI_BREAKER_FAILURES = int(os.getenv("XAI_BREAKER_FAILURES", 5))
+XAI_BREAKER_RESET_SECONDS = float(os.getenv("XAI_BREAKER_RESET_SECONDS", 30))
+
+
+class LlmUnavailableError(Exception):
+    # Raised instead of calling the API; retry_after is a hint in seconds
+    reason = "unavailable"
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(LlmUnavailableError):
+    reason = "circuit_open"
+
+
+class LlmBusyError(LlmUnavailableError):
+    reason = "busy"
+
+
+class CircuitBreaker:
+    """Opens after failure_threshold consecutive upstream failures.
+
+    While open every call is rejected. Once reset_timeout has passed one call
+    is let through as a probe: success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half_open" if self._probing else "open"
+
+    def before_call(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.reset_timeout - self.clock()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError("xAI API circuit is open", retry_after=max(remaining, 1))
+            self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("xAI circuit closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+                logger.warning("xAI circuit opened after %d consecutive failures", self._failures)
+                self._opened_at = self.clock()
+            self._probing = False
+
+    def abandon_probe(self):
+        # The probe never reached the API; let the next call probe instead
+        with self._lock:
+            self._probing = False
+
+
+def retry_reason(exc):
+    # Short label for a retryable error, None when the error should not be retried.
+    # Errors while reading a stream come straight from httpx, not wrapped by the SDK.
+    import httpx
+    import openai
+    if isinstance(exc, (openai.APITimeoutError, httpx.TimeoutException)):
+        return "timeout"
+    if isinstance(exc, (openai.APIConnectionError, httpx.TransportError)):
+        return "connection"
+    if isinstance(exc, openai.APIStatusError) and (exc.status_code == 429 or exc.status_code >= 500):
+        return str(exc.status_code)
+    return None
+
+
+def retry_after_seconds(exc):
+    # Retry-After (seconds form only) or retry-after-ms from an error response
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+class ManagedLlmClient:
+    def __init__(self, api_key, base_url, max_connections=XAI_MAX_CONNECTIONS, max_keepalive=XAI_MAX_KEEPALIVE,
+                 keepalive_expiry=XAI_KEEPALIVE_EXPIRY, http2=XAI_HTTP2, connect_timeout=XAI_CONNECT_TIMEOUT,
+                 read_timeout=XAI_READ_TIMEOUT, deadline=XAI_DEADLINE_SECONDS, max_retries=XAI_MAX_RETRIES,
+                 retry_base_delay=XAI_RETRY_BASE_DELAY, retry_max_delay=XAI_RETRY_MAX_DELAY,
+                 max_in_flight=XAI_MAX_IN_FLIGHT, breaker_failures=XAI_BREAKER_FAILURES,
+                 breaker_reset_seconds=XAI_BREAKER_RESET_SECONDS, on_retry=None):
+        import httpx
+        from openai import OpenAI
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("XAI_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.max_in_flight = max_in_flight
+        self.on_retry = on_retry
+        self.breaker = CircuitBreaker(breaker_failures, breaker_reset_seconds)
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._timeout = httpx.Timeout
+        self.http_client = httpx.Client(
+            trust_env=False,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+        )
+        self.openai = OpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=self.http_client)
+
+    def complete(self, deadline=None, **params):
+        """chat.completions.create through the pool, retries, in-flight cap and breaker."""
+        response = self._create(params, deadline)
+        self._slots.release()
+        return response
+
+    def stream(self, deadline=None, **params):
+        """Yield the chunks of a streamed completion, holding an in-flight slot until the stream ends.
+
+        Retries and the deadline cover getting the response headers; after that
+        the read timeout bounds the wait for each chunk. A stream that stalls or
+        breaks off counts as an upstream failure for the circuit breaker.
+        """
+        chunks = self._create({**params, "stream": True}, deadline)
+        try:
+            yield from chunks
+        except Exception as e:
+            if retry_reason(e) not in (None, "429"):
+                self.breaker.record_failure()
+            raise
+        finally:
+            chunks.close()
+            self._slots.release()
+
+    def _create(self, params, deadline):
+        # Returns with an in-flight slot held; the caller releases it
+        deadline = time.monotonic() + (deadline or self.deadline)
+        attempt = 0
+        while True:
+            self._acquire(deadline)
+            try:
+                remaining = deadline - time.monotonic()
+                response = self.openai.chat.completions.create(
+                    timeout=self._timeout(min(self.read_timeout, remaining), connect=min(self.connect_timeout, remaining)),
+                    **params
+                )
+            except Exception as e:
+                self._slots.release()
+                reason = retry_reason(e)
+                if reason in (None, "429"):
+                    # The upstream answered, so it is up
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+                delay = self._retry_delay(e, reason, attempt, deadline)
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning("xAI call failed (%s), retry %d in %.2fs", reason, attempt, delay)
+                if self.on_retry:
+                    self.on_retry(reason)
+                time.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return response
+
+    def _acquire(self, deadline):
+        self.breaker.before_call()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not self._slots.acquire(timeout=remaining):
+            self.breaker.abandon_probe()
+            raise LlmBusyError(f"{self.max_in_flight} xAI calls already in flight", retry_after=1)
+
+    def _retry_delay(self, exc, reason, attempt, deadline):
+        # Full jitter: uniform over [0, min(max delay, base * 2^attempt)], at least Retry-After
+        if reason is None or attempt >= self.max_retries:
+            return None
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
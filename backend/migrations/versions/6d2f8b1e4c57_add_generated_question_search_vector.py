@@ -0,0 +1,42 @@
+"""Add full-text search_vector column and GIN index to generated_question
+
+Revision ID: 6d2f8b1e4c57
+Revises: 9b4e1d7c3a62
+Create Date: 2026-10-18 23:12:40.118364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6d2f8b1e4c57'
+down_revision = '9b4e1d7c3a62'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(question_text, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(correct_answer, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(working, '')), 'C')"
+)
+
+
+def upgrade():
+    # PostgreSQL only; other databases search with the in-process index in question_search.py
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # The generated column is filled for existing rows as part of the ALTER
+    op.execute(
+        f"ALTER TABLE generated_question ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+    op.create_index('ix_generated_question_search_vector', 'generated_question', [sa.text('search_vector')],
+                    unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_generated_question_search_vector', table_name='generated_question', postgresql_using='gin')
+    op.drop_column('generated_question', 'search_vector')
@@ -0,0 +1,44 @@
+"""Add unique index on course code, year and semester
+
+Revision ID: e2a7c9b8d310
+Revises: d4f8a2c61e95
+Create Date: 2026-10-18 13:55:42.081923
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a7c9b8d310'
+down_revision = 'd4f8a2c61e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Earlier transcript uploads could leave duplicate rows. Keep the oldest of each group,
+    # move whatever hangs off the others onto it, then drop the rest so the unique
+    # constraint can be created. Plain correlated subqueries, so this also runs on SQLite.
+    duplicate_ids = """
+        SELECT c.id FROM course c
+        JOIN course k ON k.code = c.code AND k.year = c.year AND k.semester = c.semester AND k.id < c.id
+    """
+    for table in ('assessment', 'study_session', 'generated_question'):
+        op.execute(f"""
+            UPDATE {table}
+            SET course_id = (
+                SELECT min(k.id) FROM course c
+                JOIN course k ON k.code = c.code AND k.year = c.year AND k.semester = c.semester
+                WHERE c.id = {table}.course_id
+            )
+            WHERE course_id IN ({duplicate_ids})
+        """)
+    op.execute(f"DELETE FROM course WHERE id IN ({duplicate_ids})")
+    with op.batch_alter_table('course', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_course_code_year_semester', ['code', 'year', 'semester'])
+
+
+def downgrade():
+    with op.batch_alter_table('course', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_course_code_year_semester', type_='unique')
@@ -0,0 +1,110 @@
+"""MinHash signatures and LSH buckets for spotting near-duplicate question text.
+
+Text is normalised (lower case, punctuation and repeated spaces dropped) and
+cut into overlapping character shingles. A MinHash signature of NUM_PERM values
+is split into BANDS bands of ROWS values, and each band is hashed to a bucket
+key. Two texts whose shingle sets have Jaccard similarity s share at least one
+bucket with probability 1 - (1 - s**ROWS)**BANDS: about 0.99 at s = 0.7 and
+0.9998 at s = 0.8, but only 0.12 at s = 0.3. A lookup therefore only compares
+against the few texts that share a bucket, and confirms them with the exact
+Jaccard similarity of the shingles.
+
+All hashes are stable across processes, so bucket keys can be stored. NumPy
+is imported on the first signature, so importing this module stays cheap.
+"""
+import hashlib
+import random
+import re
+import zlib
+from collections import defaultdict
+
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# (a, b) of the hash a * x + b mod p standing in for each permutation; fixed seed.
+# As in datasketch, a * x + b wraps at 64 bits before the modulo.
+_rng = random.Random(20261018)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+_permutation_arrays = None
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def normalise(text):
+    return " ".join(_NON_WORD.sub(" ", (text or "").lower()).split())
+
+
+def shingles(text):
+    # Set of crc32 hashes of the character shingles; texts shorter than a shingle are one shingle
+    text = normalise(text)
+    if not text:
+        return frozenset()
+    if len(text) <= SHINGLE_SIZE:
+        return frozenset([zlib.crc32(text.encode("utf-8"))])
+    return frozenset(
+        zlib.crc32(text[i:i + SHINGLE_SIZE].encode("utf-8")) for i in range(len(text) - SHINGLE_SIZE + 1)
+    )
+
+
+def minhash(shingle_set):
+    # NUM_PERM little-endian uint64 values
+    global _permutation_arrays
+    import numpy as np
+    if _permutation_arrays is None:
+        _permutation_arrays = (
+            np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None],
+            np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None],
+        )
+    a, b = _permutation_arrays
+    values = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+    return ((a * values + b) % np.uint64(_MERSENNE_PRIME)).min(axis=1).astype("<u8")
+
+
+def band_buckets(signature):
+    # One signed 64-bit key per band; the band number is hashed in, so keys from different bands never collide
+    buckets = []
+    for band in range(BANDS):
+        packed = band.to_bytes(2, "little") + signature[band * ROWS:(band + 1) * ROWS].tobytes()
+        buckets.append(int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), "little", signed=True))
+    return buckets
+
+
+def text_signature(text):
+    # (shingles, bucket keys) of a text; an empty text has neither and never matches
+    shingle_set = shingles(text)
+    if not shingle_set:
+        return shingle_set, []
+    return shingle_set, band_buckets(minhash(shingle_set))
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class LshIndex:
+    """In-memory index of shingle sets by bucket key."""
+
+    def __init__(self):
+        self._keys_by_bucket = defaultdict(list)
+        self._shingles = {}
+
+    def __len__(self):
+        return len(self._shingles)
+
+    def add(self, key, shingle_set, buckets):
+        self._shingles[key] = shingle_set
+        for bucket in buckets:
+            self._keys_by_bucket[bucket].append(key)
+
+    def find(self, shingle_set, buckets, threshold):
+        # Key of the most similar indexed text at or above threshold, or None
+        best_key, best_similarity = None, threshold
+        for key in {key for bucket in buckets for key in self._keys_by_bucket.get(bucket, ())}:
+            similarity = jaccard(shingle_set, self._shingles[key])
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
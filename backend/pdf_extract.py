@@ -0,0 +1,101 @@
+import itertools
+import math
+import multiprocessing
+import os
+import sys
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# PyMuPDF (fitz) is imported inside the functions that open documents, so importing
+# this module stays cheap for processes that never handle a PDF
+
+# Documents with fewer pages than this are extracted on the calling thread
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 48))
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", os.cpu_count() or 1))
+
+# text: extracted pages joined together; first_page: 0-based index of the first extracted page;
+# page_offsets: start offset of each extracted page within text
+ExtractedPdf = namedtuple("ExtractedPdf", ["text", "page_count", "first_page", "page_offsets"])
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    # Spawned (not forked) workers: the web server process is multi-threaded
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def extract_page_range(pdf_bytes, start, stop):
+    import fitz  # PyMuPDF
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return [doc.load_page(page_num).get_text() for page_num in range(start, stop)]
+
+
+def is_invalid_pdf(exc):
+    # PyMuPDF's error for unreadable documents; if PyMuPDF was never imported, no PDF was opened
+    fitz = sys.modules.get("fitz")
+    return fitz is not None and isinstance(exc, fitz.fitz.FileDataError)
+
+
+def page_bounds(page_count, first_page=0, max_pages=None):
+    start = min(max(first_page, 0), page_count)
+    stop = page_count if max_pages is None else min(page_count, start + max(max_pages, 0))
+    return start, stop
+
+
+def extract_pdf_text(pdf_bytes, first_page=0, max_pages=None, parallel=None):
+    """Extract the text of a page range, splitting large ranges across a process pool.
+
+    Pages are collected into a list and joined once, so the cost is linear in
+    the text length. Raises PyMuPDF's errors for unreadable documents.
+    """
+    import fitz  # PyMuPDF
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        page_count = doc.page_count
+    start, stop = page_bounds(page_count, first_page, max_pages)
+    num_pages = stop - start
+    if parallel is None:
+        parallel = num_pages >= PDF_PARALLEL_MIN_PAGES and PDF_EXTRACT_WORKERS > 1
+
+    if parallel and num_pages:
+        # Two chunks per worker evens out pages that are slower to lay out
+        chunk_size = math.ceil(num_pages / (PDF_EXTRACT_WORKERS * 2))
+        starts = list(range(start, stop, chunk_size))
+        stops = [min(s + chunk_size, stop) for s in starts]
+        pages = []
+        for chunk in get_pool().map(extract_page_range, itertools.repeat(pdf_bytes), starts, stops):
+            pages.extend(chunk)
+    else:
+        pages = extract_page_range(pdf_bytes, start, stop)
+
+    offsets = list(itertools.accumulate((len(page) for page in pages[:-1]), initial=0)) if pages else []
+    return ExtractedPdf("".join(pages), page_count, start, offsets)
+
+
+def select_pages(extracted, first_page=0, max_pages=None):
+    # Slice a full-document extraction down to a page range without re-parsing
+    start, stop = page_bounds(len(extracted.page_offsets), first_page, max_pages)
+    if start == 0 and stop == len(extracted.page_offsets):
+        return extracted
+    bounds = extracted.page_offsets + [len(extracted.text)]
+    return ExtractedPdf(
+        extracted.text[bounds[start]:bounds[stop]],
+        extracted.page_count,
+        start,
+        [offset - bounds[start] for offset in extracted.page_offsets[start:stop]]
+    )
+
+
+def iter_page_texts(extracted):
+    bounds = extracted.page_offsets + [len(extracted.text)]
+    for start, stop in zip(bounds, bounds[1:]):
+        yield extracted.text[start:stop]
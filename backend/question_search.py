@@ -0,0 +1,187 @@
+"""In-process full-text index over saved questions, for databases without tsvector.
+
+On PostgreSQL /api/questions/search runs on the generated search_vector column
+and its GIN index. Elsewhere (SQLite in development and tests) the app keeps a
+QuestionSearchIndex per process instead: an inverted index from stemmed terms
+to question ids, weighted by field like the setweight() calls on PostgreSQL
+(question text A, correct answer B, working C).
+
+Queries follow websearch_to_tsquery loosely: every term must match, a term
+prefixed with "-" must not, quotes are ignored. Stemming is a handful of
+English suffix rules, enough to match plurals and simple verb forms.
+"""
+import html
+import math
+import re
+from collections import defaultdict
+
+# ts_rank's default weights for A, B and C
+FIELD_WEIGHTS = (("question_text", 1.0), ("correct_answer", 0.4), ("working", 0.2))
+SNIPPET_WORDS = 30
+# Match markers in snippets before they are escaped; PostgreSQL's ts_headline is given the same ones
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it its of on or that the their then "
+    "there these they this to was were what when where which while who why will with".split()
+)
+_WORD = re.compile(r"[^\W_]+")
+_QUERY_TERM = re.compile(r"(-?)([^\W_]+)")
+_SATURATION = 1.2
+
+
+def stem(word):
+    # First matching rule wins; the "ss" rule keeps words like "class" whole rather than dropping an "s"
+    for suffix, replacement, min_length in (("ies", "y", 5), ("sses", "ss", 5), ("ing", "", 6),
+                                            ("ed", "", 5), ("ss", "ss", 0), ("s", "", 4)):
+        if word.endswith(suffix) and len(word) >= min_length:
+            return word[:len(word) - len(suffix)] + replacement
+    return word
+
+
+def terms(text):
+    # Stemmed terms of a text, stop words left out
+    words = (word.lower() for word in _WORD.findall(text or ""))
+    return [stem(word) for word in words if word not in STOP_WORDS]
+
+
+def parse_query(query):
+    # (terms that must match, terms that must not)
+    include, exclude = [], set()
+    for negated, word in _QUERY_TERM.findall(query or ""):
+        word = word.lower()
+        if word in STOP_WORDS:
+            continue
+        if negated:
+            exclude.add(stem(word))
+        elif stem(word) not in include:
+            include.append(stem(word))
+    return include, exclude
+
+
+def mark_snippet(snippet):
+    # HTML-escape a snippet and turn the match markers into <mark> tags
+    return html.escape(snippet).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+
+
+def highlight(fields, query, max_words=SNIPPET_WORDS):
+    """Up to max_words of the first field that matches query, with the matches marked.
+
+    fields is a sequence of texts in priority order; the first one is used
+    when none of them matches.
+    """
+    wanted = set(parse_query(query)[0])
+    texts = [text for text in fields if text]
+    for text in texts:
+        words = list(_WORD.finditer(text))
+        hits = [i for i, word in enumerate(words) if stem(word.group().lower()) in wanted]
+        if hits:
+            break
+    else:
+        text = texts[0] if texts else ""
+        words, hits = list(_WORD.finditer(text)), []
+    if not words:
+        return text
+    # Start a few words before the first match
+    first = max(0, min(hits[0] - 5, len(words) - max_words)) if hits else 0
+    last = min(len(words), first + max_words)
+    hits = set(hits)
+    pieces, position = [], words[first].start() if first else 0
+    for i in range(first, last):
+        word = words[i]
+        pieces.append(text[position:word.start()])
+        pieces.append(f"{HIGHLIGHT_START}{word.group()}{HIGHLIGHT_STOP}" if i in hits else word.group())
+        position = word.end()
+    if last == len(words):
+        pieces.append(text[position:])
+    return ("… " if first else "") + "".join(pieces) + (" …" if last < len(words) else "")
+
+
+class QuestionSearchIndex:
+    """Inverted index of question ids by stemmed term. Not thread-safe; callers lock.
+
+    Postings are kept in dicts while questions are added and turned into sorted
+    NumPy arrays the first time a term is searched after a change, so scoring a
+    term that matches most of the bank is a few vector operations.
+    """
+
+    def __init__(self):
+        self._postings = defaultdict(dict)  # term -> {question id: field-weighted term count}
+        self._arrays = {}  # term -> (sorted question ids, weights), for terms unchanged since last built
+        self._course_ids = {}
+        self._course_array = None  # course id by question id
+        self.max_id = 0
+
+    def __len__(self):
+        return len(self._course_ids)
+
+    def add(self, question_id, course_id, question_text, correct_answer, working):
+        fields = {"question_text": question_text, "correct_answer": correct_answer, "working": working}
+        for name, weight in FIELD_WEIGHTS:
+            for term in terms(fields[name]):
+                postings = self._postings[term]
+                postings[question_id] = postings.get(question_id, 0.0) + weight
+                self._arrays.pop(term, None)
+        self._course_ids[question_id] = course_id
+        self._course_array = None
+        self.max_id = max(self.max_id, question_id)
+
+    def _term_arrays(self, term):
+        import numpy as np
+        if term not in self._arrays:
+            postings = self._postings[term]
+            ids = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            weights = np.fromiter(postings.values(), dtype=np.float64, count=len(postings))
+            order = np.argsort(ids)
+            self._arrays[term] = (ids[order], weights[order])
+        return self._arrays[term]
+
+    def _courses(self):
+        import numpy as np
+        if self._course_array is None:
+            self._course_array = np.zeros(self.max_id + 1, dtype=np.int64)
+            self._course_array[np.fromiter(self._course_ids.keys(), dtype=np.int64)] = \
+                np.fromiter(self._course_ids.values(), dtype=np.int64)
+        return self._course_array
+
+    def search(self, query, course_id=None, limit=20, after=None):
+        """Best matches first as [(score, question id)], plus whether more follow.
+
+        after is the (score, question id) of the last hit of the previous page.
+        """
+        import numpy as np
+        include, exclude = parse_query(query)
+        if not include or not all(term in self._postings for term in include):
+            return [], False
+        # Start from the rarest term and narrow down
+        include.sort(key=lambda term: len(self._postings[term]))
+        ids, weights = self._term_arrays(include[0])
+        scores = math.log(1 + len(self) / len(ids)) * weights / (weights + _SATURATION)
+        for term in include[1:]:
+            term_ids, term_weights = self._term_arrays(term)
+            positions = np.minimum(np.searchsorted(term_ids, ids), len(term_ids) - 1)
+            found = term_ids[positions] == ids
+            ids, scores, positions = ids[found], scores[found], positions[found]
+            weights = term_weights[positions]
+            scores += math.log(1 + len(self) / len(term_ids)) * weights / (weights + _SATURATION)
+        for term in exclude:
+            if term in self._postings:
+                keep = ~np.isin(ids, self._term_arrays(term)[0], assume_unique=True)
+                ids, scores = ids[keep], scores[keep]
+        if course_id is not None:
+            keep = self._courses()[ids] == course_id
+            ids, scores = ids[keep], scores[keep]
+        scores = np.round(scores, 6)
+        if after is not None:
+            keep = (scores < after[0]) | ((scores == after[0]) & (ids < after[1]))
+            ids, scores = ids[keep], scores[keep]
+
+        count = limit + 1
+        if len(ids) > count:
+            # Everything scoring at least the count-th best score, then an exact sort of those
+            keep = scores >= np.partition(scores, len(scores) - count)[len(scores) - count]
+            ids, scores = ids[keep], scores[keep]
+        order = np.lexsort((-ids, -scores))[:count]
+        page = [(float(scores[i]), int(ids[i])) for i in order]
+        return page[:limit], len(page) > limit
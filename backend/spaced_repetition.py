@@ -0,0 +1,47 @@
+"""SM-2 style review scheduling for saved questions.
+
+Each question carries (ease, interval in days, repetitions). A correct answer
+moves it to the next interval: 1 day, then 6, then the previous interval times
+the ease, up to MAX_INTERVAL_DAYS. A wrong answer costs 0.2 ease (never below
+MIN_EASE), resets the repetitions and brings the question back after
+LAPSE_MINUTES. Answers are right/wrong only, so a correct one counts as SM-2
+quality 4, which leaves the ease unchanged.
+"""
+from collections import namedtuple
+from datetime import timedelta
+
+START_EASE = 2.5
+MIN_EASE = 1.3
+LAPSE_EASE_PENALTY = 0.2
+LAPSE_MINUTES = 10
+FIRST_INTERVALS = (1.0, 6.0)  # days after the first and second correct answers in a row
+MAX_INTERVAL_DAYS = 365.0  # without a cap long streaks grow past what a datetime can hold
+
+ReviewState = namedtuple("ReviewState", "ease interval_days repetitions lapses")
+NEW_REVIEW = ReviewState(START_EASE, 0.0, 0, 0)
+
+
+def next_review(state, correct):
+    # (new ReviewState, time until the question is due again)
+    if not correct:
+        state = ReviewState(max(MIN_EASE, state.ease - LAPSE_EASE_PENALTY), 0.0, 0, state.lapses + 1)
+        return state, timedelta(minutes=LAPSE_MINUTES)
+    repetitions = state.repetitions + 1
+    if repetitions <= len(FIRST_INTERVALS):
+        interval = FIRST_INTERVALS[repetitions - 1]
+    else:
+        interval = min(round(state.interval_days * state.ease, 2), MAX_INTERVAL_DAYS)
+    state = ReviewState(state.ease, interval, repetitions, state.lapses)
+    return state, timedelta(days=interval)
+
+
+def replay(answers, state=NEW_REVIEW):
+    # State after a question's (answered_at, is_correct) history in time order, and when it is due;
+    # answers without a verdict don't move the schedule
+    due_at = None
+    for answered_at, correct in answers:
+        if correct is None:
+            continue
+        state, wait = next_review(state, correct)
+        due_at = answered_at + wait
+    return state, due_at
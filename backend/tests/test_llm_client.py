@@ -0,0 +1,121 @@
+"""ManagedLlmClient against tools/fake_xai_server.py, served from a thread on a free port.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BACKEND)
+sys.path.insert(0, os.path.join(BACKEND, "tools"))
+
+import openai  # noqa: E402
+
+from fake_xai_server import FakeXaiHandler  # noqa: E402
+from llm_client import CircuitOpenError, LlmBusyError, ManagedLlmClient  # noqa: E402
+
+MESSAGES = [{"role": "user", "content": "Generate 2 flashcards"}]
+DEFAULT_CONFIG = dict(FakeXaiHandler.config)
+
+
+@pytest.fixture
+def fake_xai():
+    FakeXaiHandler.config = dict(DEFAULT_CONFIG)
+    FakeXaiHandler.stats = {"requests": 0, "errors": 0}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeXaiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def configure(**settings):
+    FakeXaiHandler.config = {**FakeXaiHandler.config, **settings}
+
+
+def make_client(base_url, **options):
+    options = {"http2": False, "retry_base_delay": 0.01, "retry_max_delay": 0.05, **options}
+    return ManagedLlmClient(api_key="test", base_url=base_url, **options)
+
+
+def test_retries_until_the_upstream_recovers(fake_xai):
+    configure(fail_next=2, error_status=[503])
+    retries = []
+    client = make_client(fake_xai, max_retries=3, on_retry=retries.append)
+
+    response = client.complete(model="grok-3", messages=MESSAGES)
+
+    assert "Fake card" in response.choices[0].message.content
+    assert retries == ["503", "503"]
+    assert FakeXaiHandler.stats == {"requests": 3, "errors": 2}
+    assert client.breaker.state == "closed"
+
+
+def test_gives_up_after_max_retries(fake_xai):
+    configure(error_rate=1.0, error_status=[502])
+    client = make_client(fake_xai, max_retries=2, breaker_failures=10)
+
+    with pytest.raises(openai.APIStatusError):
+        client.complete(model="grok-3", messages=MESSAGES)
+    assert FakeXaiHandler.stats["requests"] == 3
+
+
+def test_breaker_opens_and_rejects_without_calling_upstream(fake_xai):
+    configure(error_rate=1.0, error_status=[503])
+    client = make_client(fake_xai, max_retries=0, breaker_failures=2, breaker_reset_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(openai.APIStatusError):
+            client.complete(model="grok-3", messages=MESSAGES)
+    assert client.breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError) as raised:
+        client.complete(model="grok-3", messages=MESSAGES)
+    assert raised.value.retry_after > 0
+    assert FakeXaiHandler.stats["requests"] == 2
+
+
+def test_breaker_probe_closes_the_circuit(fake_xai):
+    configure(fail_next=1)
+    client = make_client(fake_xai, max_retries=0, breaker_failures=1, breaker_reset_seconds=0.1)
+
+    with pytest.raises(openai.APIStatusError):
+        client.complete(model="grok-3", messages=MESSAGES)
+    assert client.breaker.state == "open"
+    time.sleep(0.15)
+    client.complete(model="grok-3", messages=MESSAGES)
+    assert client.breaker.state == "closed"
+
+
+def test_busy_when_every_slot_is_taken(fake_xai):
+    configure(latency=0.5)
+    client = make_client(fake_xai, max_in_flight=1)
+    slow = threading.Thread(target=client.complete, kwargs={"model": "grok-3", "messages": MESSAGES})
+    slow.start()
+    time.sleep(0.1)
+
+    with pytest.raises(LlmBusyError):
+        client.complete(deadline=0.1, model="grok-3", messages=MESSAGES)
+    slow.join()
+    # The slot is handed back once the slow call is done
+    client.complete(deadline=2, model="grok-3", messages=MESSAGES)
+
+
+def test_stalled_stream_counts_as_a_failure(fake_xai):
+    # Headers come at once, then each chunk waits longer than the read timeout
+    configure(latency=5.0)
+    client = make_client(fake_xai, read_timeout=0.2, breaker_failures=1, breaker_reset_seconds=60)
+
+    with pytest.raises(Exception) as raised:
+        for _ in client.stream(model="grok-3", messages=MESSAGES):
+            pass
+    assert not isinstance(raised.value, LlmBusyError)
+    assert client.breaker.state == "open"
+    # The in-flight slot was released
+    assert client._slots.acquire(timeout=0)
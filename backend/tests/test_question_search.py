@@ -0,0 +1,24 @@
+"""Stemming and search in the in-process QuestionSearchIndex.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from question_search import QuestionSearchIndex, stem  # noqa: E402
+
+
+def test_stem():
+    assert [stem(word) for word in ("classes", "class", "studies", "cats", "gas")] == \
+        ["class", "class", "study", "cat", "gas"]
+
+
+def test_plural_matches_singular():
+    index = QuestionSearchIndex()
+    index.add(1, 7, "Which classes inherit from object?", "All of them", None)
+    index.add(2, 7, "What is a metaclass?", "A class of a class", None)
+    hits, has_more = index.search("class")
+    assert sorted(question_id for _, question_id in hits) == [1, 2]
+    assert not has_more
@@ -0,0 +1,76 @@
+"""parse_transcript on hand-written page texts, including units with lines missing.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from transcript_parser import parse_transcript  # noqa: E402
+
+
+def parse(*pages):
+    return parse_transcript(["\n".join(page) for page in pages])
+
+
+def test_units_with_every_field():
+    assert parse([
+        "Statement of Academic Record", "Semester 1, 2023",
+        "ABC101.1", "Intro to ABC", "12", "Distinction",
+        "  DEF202.2  ", "Intro to DEF", "12", "Enrolled",
+    ]) == [
+        ("ABC101.1", 2023, "Semester 1", "Intro to ABC", 6),
+        ("DEF202.2", 2023, "Semester 1", "Intro to DEF", None),
+    ]
+
+
+def test_missing_grade_does_not_swallow_the_next_unit():
+    assert parse([
+        "Semester 2, 2023",
+        "ABC101.1", "Intro to ABC", "12",
+        "DEF202.2", "Intro to DEF", "12", "Pass",
+    ]) == [
+        ("ABC101.1", 2023, "Semester 2", "Intro to ABC", None),
+        ("DEF202.2", 2023, "Semester 2", "Intro to DEF", 4),
+    ]
+
+
+def test_missing_credit_points_and_trailing_lines():
+    assert parse([
+        "Semester Summer, 2024",
+        "ABC101.1", "Intro to ABC", "Credit",
+        "DEF202.2", "Intro to DEF",
+        "Semester 1, 2025",
+        "GHI303.3",
+    ]) == [
+        ("ABC101.1", 2024, "Semester Summer", "Intro to ABC", 5),
+        ("DEF202.2", 2024, "Semester Summer", "Intro to DEF", None),
+        ("GHI303.3", 2025, "Semester 1", "TBD", None),
+    ]
+
+
+def test_unit_split_across_pages_and_units_before_a_header():
+    assert parse(
+        ["XYZ999.9", "Before any semester", "12", "Pass", "Semester 1, 2022", "ABC101.1", "Intro to ABC"],
+        ["12", "High Distinction"],
+    ) == [("ABC101.1", 2022, "Semester 1", "Intro to ABC", 7)]
+
+
+def test_unit_code_in_the_name_position_closes_the_unit():
+    assert parse([
+        "Semester 1, 2023",
+        "ABC101.1",
+        "DEF202.2", "Intro to DEF", "12", "Pass",
+    ]) == [
+        ("ABC101.1", 2023, "Semester 1", "TBD", None),
+        ("DEF202.2", 2023, "Semester 1", "Intro to DEF", 4),
+    ]
+
+
+def test_semester_header_in_the_name_position_closes_the_unit():
+    assert parse([
+        "Semester 1, 2023",
+        "ABC101.1",
+        "Semester 2, 2023", "12", "Pass",
+    ]) == [("ABC101.1", 2023, "Semester 1", "TBD", None)]
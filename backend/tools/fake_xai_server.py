@@ -0,0 +1,222 @@
+"""Local stand-in for the xAI chat completions API.
+
+Run it and point the backend at it:
+
+    python tools/fake_xai_server.py --port 8765 --latency 2
+    XAI_BASE_URL=http://127.0.0.1:8765/v1 XAI_API_KEY=fake python app.py
+
+Practice prompts get "Generate N ..." items back, grading prompts get a
+marked rubric. --latency delays every response to mimic a slow provider;
+with "stream": true the delay is spread evenly over the streamed chunks.
+--token-latency adds a delay per completion token (4 characters), so long
+completions take longer, as they do with a real model.
+
+--error-rate answers that fraction of completions with an error status picked
+from --error-status (after the latency), with Retry-After set when --retry-after
+is given. The "fail_next" setting fails exactly that many of the next
+completions, and "ignore_avoid" makes practice prompts that list questions not
+to repeat get the same items anyway, like a model that ignores the list. The
+settings can be changed while the server runs, e.g. to simulate an outage and
+the recovery:
+
+    curl -X POST localhost:8765/fake/config -d '{"error_rate": 1, "error_status": [503]}'
+    curl localhost:8765/fake/stats
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+TOPIC_WORDS = [
+    "entropy", "gradient", "lattice", "protocol", "variance", "kernel", "enzyme", "tariff", "syntax",
+    "inertia", "mitosis", "ledger", "quorum", "photon", "cohort", "vector", "tensor", "allele",
+    "bandwidth", "catalyst", "dividend", "estuary", "fulcrum", "glacier", "hashing", "isotope",
+]
+
+
+def topic(label):
+    # A few words picked by label, so different items don't read as near-duplicates of each other
+    return " ".join(random.Random(label).sample(TOPIC_WORDS, 3))
+
+
+def practice_content(prompt, ignore_avoid=False):
+    match = re.search(r"Generate (\d+)", prompt)
+    num_items = int(match.group(1)) if match else 5
+    # Chunked practice sets ask for "batch k of n"; prefix their items with k so batches differ.
+    # Prompts that list questions not to repeat get a random prefix, unless ignore_avoid is set.
+    batch = re.search(r"batch (\d+) of \d+", prompt)
+    prefix = f"{batch.group(1)}-" if batch else ""
+    if "Do not repeat" in prompt and not ignore_avoid:
+        prefix = f"{uuid.uuid4().hex[:8]}-{prefix}"
+    items = [{
+        "question": f"Fake question {prefix}{i + 1} on {topic(prefix + str(i))}?",
+        "answer": f"Answer {prefix}{i + 1}",
+        "working": f"Working for question {prefix}{i + 1}.",
+        "front": f"Fake card {prefix}{i + 1} on {topic(prefix + str(i))}",
+        "back": f"Back {prefix}{i + 1}"
+    } for i in range(num_items)]
+    return json.dumps(items) + "###"
+
+
+def grading_content():
+    return json.dumps({
+        "overallPoints": "80/100",
+        "markedRubric": [{
+            "criterion": "Fake criterion",
+            "points": "8/10",
+            "feedback": "Solid work.",
+            "specificExample": "Paragraph 1.",
+            "improvement": "Cite more sources.",
+            "loss": "Missing references."
+        }]
+    })
+
+
+def completion_content(body, config):
+    messages = body.get("messages", [])
+    system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+    user = next((m["content"] for m in messages if m.get("role") == "user"), "")
+    if "grades student assessments" in system:
+        return grading_content()
+    return practice_content(user, config["ignore_avoid"])
+
+
+def response_delay(config, content):
+    return config["latency"] + config["token_latency"] * (len(content) // 4)
+
+
+class FakeXaiHandler(BaseHTTPRequestHandler):
+    # Changed at runtime through POST /fake/config
+    config = {"latency": 0.0, "token_latency": 0.0, "error_rate": 0.0, "error_status": [503], "retry_after": None,
+              "fail_next": 0, "ignore_avoid": False}
+    stats = {"requests": 0, "errors": 0}
+    stats_lock = threading.Lock()
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/fake/stats":
+            self.send_error(404)
+            return
+        with self.stats_lock:
+            self.send_json(200, {**self.stats, "config": self.config})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path.rstrip("/") == "/fake/config":
+            unknown = set(body) - set(self.config)
+            if unknown:
+                self.send_json(400, {"error": f"unknown settings: {sorted(unknown)}"})
+                return
+            FakeXaiHandler.config = {**self.config, **body}
+            self.send_json(200, self.config)
+            return
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        with self.stats_lock:
+            config = self.config
+            failing = config["fail_next"] > 0 or random.random() < config["error_rate"]
+            if config["fail_next"] > 0:
+                FakeXaiHandler.config = config = {**config, "fail_next": config["fail_next"] - 1}
+            self.stats["requests"] += 1
+            self.stats["errors"] += failing
+        if failing:
+            time.sleep(config["latency"])
+            status = random.choice(config["error_status"])
+            headers = {"Retry-After": str(config["retry_after"])} if config["retry_after"] is not None else {}
+            self.send_json(status, {"error": {"message": f"Injected error {status}", "type": "fake_error"}}, headers)
+            return
+        content = completion_content(body, config)
+        if body.get("stream"):
+            self.stream_completion(body, content)
+            return
+        time.sleep(response_delay(config, content))
+        self.send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "grok-3"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 100, "completion_tokens": len(content) // 4, "total_tokens": 100 + len(content) // 4}
+        })
+
+    def send_json(self, status, data, headers=None):
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def stream_completion(self, body, content, chunk_size=16):
+        # Server-sent chunks in the OpenAI streaming format, closed by "data: [DONE]"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        pieces = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+        for piece in pieces:
+            time.sleep(response_delay(self.config, content) / len(pieces))
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "grok-3"),
+                "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        if (body.get("stream_options") or {}).get("include_usage"):
+            usage_chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "grok-3"),
+                "choices": [],
+                "usage": {"prompt_tokens": 100, "completion_tokens": len(content) // 4, "total_tokens": 100 + len(content) // 4}
+            }
+            self.wfile.write(f"data: {json.dumps(usage_chunk)}\n\n".encode("utf-8"))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before each response")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="extra seconds per completion token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of completions answered with an error")
+    parser.add_argument("--error-status", type=int, nargs="+", default=[503], help="statuses to pick injected errors from")
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds sent with injected errors")
+    args = parser.parse_args()
+
+    FakeXaiHandler.config = {
+        "latency": args.latency,
+        "token_latency": args.token_latency,
+        "error_rate": args.error_rate,
+        "error_status": args.error_status,
+        "retry_after": args.retry_after,
+        "fail_next": 0,
+        "ignore_avoid": False
+    }
+    server = ThreadingHTTPServer((args.host, args.port), FakeXaiHandler)
+    print(f"Fake xAI server on http://{args.host}:{args.port}/v1 (latency {args.latency}s, error rate {args.error_rate})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Single-pass transcript parser.
+
+Lines are read page by page from the extracted text and fed through a small
+state machine driven by a TranscriptLayout:
+
+* between units, a line is either a semester header, a unit code, or noise;
+* after a unit code, the layout's field table is consumed in order (for the
+  default layout: name, credit points, grade). A field with a pattern that the
+  line does not match is treated as absent and the same line moves on to the
+  next field, and a semester header or unit code always closes the current
+  unit. Layouts with missing or extra lines therefore parse without
+  backtracking or fixed line offsets.
+
+Nothing is logged per line.
+"""
+import re
+from collections import namedtuple
+
+ParsedCourse = namedtuple("ParsedCourse", ["code", "year", "semester", "name", "grade"])
+
+# One entry per line expected after the unit code. pattern=None accepts any line.
+LayoutField = namedtuple("LayoutField", ["name", "pattern"])
+
+
+class TranscriptLayout:
+    def __init__(self, semester_pattern, unit_code_pattern, fields, grade_mapping, semester_format="Semester {term}"):
+        # semester_pattern needs named groups 'term' and 'year'
+        self.semester_regex = re.compile(semester_pattern)
+        self.unit_code_regex = re.compile(unit_code_pattern)
+        # Either kind of line closes the unit being read
+        self.boundary_regex = re.compile(f"(?:{semester_pattern})|(?:{unit_code_pattern})")
+        self.fields = [LayoutField(name, re.compile(pattern) if pattern else None) for name, pattern in fields]
+        self.grade_mapping = dict(grade_mapping)
+        self.semester_format = semester_format
+
+    def grade_for(self, grade_text):
+        # None for enrolled/ungraded units and for grade text the layout does not know
+        return self.grade_mapping.get(grade_text)
+
+
+DEFAULT_LAYOUT = TranscriptLayout(
+    semester_pattern=r"Semester (?P<term>\d|Summer), (?P<year>\d{4})",
+    unit_code_pattern=r"^[A-Z]{3}\d{3}\.\d$",
+    fields=[
+        ("name", None),
+        ("credit_points", r"^\d+(\.\d+)?$"),
+        ("grade", None),
+    ],
+    grade_mapping={
+        "High Distinction": 7,
+        "Distinction": 6,
+        "Credit": 5,
+        "Pass": 4,
+        "Fail": 3
+    }
+)
+
+LAYOUTS = {"default": DEFAULT_LAYOUT}
+
+
+def register_layout(name, layout):
+    LAYOUTS[name] = layout
+
+
+def parse_transcript(pages, layout=DEFAULT_LAYOUT):
+    """Parse an iterable of page texts into ParsedCourse tuples.
+
+    Pages are consumed one at a time. Units seen before the first semester
+    header are skipped, as they cannot be placed in a year and semester.
+    """
+    semester_match = layout.semester_regex.match
+    unit_code_match = layout.unit_code_regex.match
+    boundary_match = layout.boundary_regex.match
+    field_names = [field.name for field in layout.fields]
+    field_patterns = [field.pattern.match if field.pattern else None for field in layout.fields]
+    num_fields = len(field_names)
+    grade_for = layout.grade_for
+
+    courses = []
+    year = semester = None
+    unit = None  # field values of the unit being read, keyed by field name
+    field_index = 0
+
+    for page_text in pages:
+        for line in page_text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+
+            if unit is not None:
+                if not boundary_match(line):
+                    # Skip optional fields this line does not match, then consume it
+                    while field_index < num_fields and field_patterns[field_index] is not None \
+                            and not field_patterns[field_index](line):
+                        field_index += 1
+                    if field_index < num_fields:
+                        unit[field_names[field_index]] = line
+                        field_index += 1
+                    if field_index < num_fields:
+                        continue
+                    line = None
+                if year is not None:
+                    grade_text = unit.get("grade")
+                    courses.append(ParsedCourse(
+                        unit["code"], year, semester, unit.get("name", "TBD"),
+                        grade_for(grade_text) if grade_text is not None else None
+                    ))
+                unit = None
+                if line is None:
+                    continue
+
+            match = semester_match(line)
+            if match:
+                year = int(match.group("year"))
+                semester = layout.semester_format.format(term=match.group("term"))
+            elif unit_code_match(line):
+                unit = {"code": line}
+                field_index = 0
+
+    if unit is not None and year is not None:
+        grade_text = unit.get("grade")
+        courses.append(ParsedCourse(
+            unit["code"], year, semester, unit.get("name", "TBD"),
+            grade_for(grade_text) if grade_text is not None else None
+        ))
+    return courses
@@ -1,6 +1,8 @@
 import React, { useState } from 'react';
 import { Container, Row, Col, Form, Button, Card, Spinner, Alert } from 'react-bootstrap';
 
+const JOB_POLL_INTERVAL_MS = 1500;
+
 function AIAssistedGraderPage() {
   const [rubricFile, setRubricFile] = useState(null);
   const [assignmentFile, setAssignmentFile] = useState(null);
@@ -33,14 +35,27 @@ function AIAssistedGraderPage() {
     formData.append('assessment', assignmentFile);
 
     try {
-        const response = await fetch('http://localhost:5000/api/grade_assessment', {
+        // Grading runs as a background job; submit it, then poll until it finishes
+        const response = await fetch('http://localhost:5000/api/jobs/grade_assessment', {
             method: 'POST', body: formData,
         });
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
-        const data = await response.json();
-        setGradeResult(data);
+        const { job_id } = await response.json();
+        let job;
+        do {
+            await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+            const jobResponse = await fetch(`http://localhost:5000/api/jobs/${job_id}`);
+            if (!jobResponse.ok) {
+                throw new Error(`HTTP error! status: ${jobResponse.status}`);
+            }
+            job = await jobResponse.json();
+        } while (job.status === 'queued' || job.status === 'running');
+        if (job.status === 'failed') {
+            throw new Error(job.error);
+        }
+        setGradeResult(job.result);
     } catch (e) {
         setError(`Failed to grade assignment: ${e.message}`);
     } finally {
@@ -13,7 +13,6 @@ import {
   Tooltip,
   Legend,
 } from 'chart.js';
-import * as ss from 'simple-statistics'; // 1. Import the statistics library
 
 import MonteCarloChart from '../components/MonteCarloChart.js';
 
@@ -22,35 +21,20 @@ ChartJS.register(
 );
 
 // --- Component for the GPA Trend Chart (Now with Trendline) ---
-function GpaTrendChart({ courses, trendlineData, primaryColor, secondaryColor }) { // Receives trendline data as a prop
+// Semester means and the regression come precomputed from /api/analytics/gpa_trend
+function GpaTrendChart({ trend, primaryColor, secondaryColor }) {
   const [chartData, setChartData] = useState(null);
 
   useEffect(() => {
-    if (!courses || courses.length === 0) return;
-    
-    const groupedBySemester = courses.reduce((acc, course) => {
-      if (course.year && course.semester) {
-        const key = `${course.year} - ${course.semester}`;
-        if (!acc[key]) acc[key] = [];
-        acc[key].push(course.grade);
-      }
-      return acc;
-    }, {});
-
-    const semesterGpas = Object.entries(groupedBySemester).map(([key, grades]) => ({
-      semester: key,
-      gpa: ss.mean(grades) // Using simple-statistics for clarity
-    }));
-
-    const sortedData = semesterGpas.sort((a, b) => a.semester.localeCompare(b.semester));
+    if (!trend || trend.semesters.length === 0) return;
 
     setChartData({
-      labels: sortedData.map(d => d.semester),
+      labels: trend.semesters.map(d => d.label),
       datasets: [
         {
           type: 'line', // Specify chart type
           label: 'GPA per Semester',
-          data: sortedData.map(d => d.gpa),
+          data: trend.semesters.map(d => d.gpa),
           borderColor: primaryColor,
           backgroundColor: primaryColor.replace('rgb', 'rgba').replace(')', ', 0.2)'),
           fill: true,
@@ -60,7 +44,7 @@ function GpaTrendChart({ courses, trendlineData, primaryColor, secondaryColor })
         {
           type: 'line',
           label: 'Performance Trend',
-          data: trendlineData,
+          data: trend.trendline,
           fill: false,
           borderColor: secondaryColor,
           borderDash: [5, 5], // Makes the line dashed
@@ -68,7 +52,7 @@ function GpaTrendChart({ courses, trendlineData, primaryColor, secondaryColor })
         }
       ],
     });
-  }, [courses, trendlineData, primaryColor, secondaryColor]); // Re-render if courses or trendline changes
+  }, [trend, primaryColor, secondaryColor]); // Re-render if the trend or colors change
 
   return (
     <Card bg="dark" text="white" className="mb-4">
@@ -82,37 +66,17 @@ function GpaTrendChart({ courses, trendlineData, primaryColor, secondaryColor })
 
 
 function AnalyticsPage() {
-  const [courses, setCourses] = useState([]);
-  // --- NEW: State for our trendline data points ---
-  const [trendlineData, setTrendlineData] = useState([]);
+  const [trend, setTrend] = useState(null);
   const [primaryColor, setPrimaryColor] = useState(localStorage.getItem('primaryColor') || 'rgb(75, 192, 192)');
   const [secondaryColor, setSecondaryColor] = useState(localStorage.getItem('secondaryColor') || 'rgba(255, 99, 132, 0.8)');
 
   useEffect(() => {
     const fetchAndProcessData = async () => {
       try {
-        const response = await fetch('/api/courses');
-        const data = await response.json();
-        const validCourses = data.courses.filter(c => c.grade != null && c.year && c.semester);
-        setCourses(validCourses);
-
-        // --- Trendline Calculation Logic ---
-        const semesterGpas = Object.values(validCourses.reduce((acc, c) => {
-            const key = `${c.year}-${c.semester}`;
-            if (!acc[key]) acc[key] = { grades: [], key };
-            acc[key].grades.push(c.grade);
-            return acc;
-        }, {})).map(sem => ({ ...sem, gpa: ss.mean(sem.grades) })).sort((a,b) => a.key.localeCompare(b.key));
-        
-        if (semesterGpas.length > 1) {
-            const dataForRegression = semesterGpas.map((d, index) => [index, d.gpa]);
-            const { m, b } = ss.linearRegression(dataForRegression);
-            const line = ss.linearRegressionLine({ m, b });
-            
-            // Create a trendline data point for each semester
-            setTrendlineData(semesterGpas.map((d, index) => line(index)));
-        }
-
+        // One cached server-side computation shared by all analytics widgets
+        const response = await fetch('/api/analytics/gpa_trend');
+        if (!response.ok) throw new Error(`Failed to fetch GPA trend: ${response.status}`);
+        setTrend(await response.json());
       } catch (error) { console.error("Error fetching data:", error); }
     };
     fetchAndProcessData();
@@ -134,14 +98,14 @@ function AnalyticsPage() {
       <h2 className="mb-4">Your Academic Analytics</h2>
       <Row>
         <Col>
-          {/* Pass the calculated trendline data and colors to the chart component */}
-          <GpaTrendChart courses={courses} trendlineData={trendlineData} primaryColor={primaryColor} secondaryColor={secondaryColor} />
+          {/* Pass the server-computed trend and colors to the chart component */}
+          <GpaTrendChart trend={trend} primaryColor={primaryColor} secondaryColor={secondaryColor} />
         </Col>
       </Row>
       <Row>
         <Col>
           {/* The old Monte Carlo chart is still here for comparison */}
-          <MonteCarloChart courses={courses} />
+          <MonteCarloChart trend={trend} />
         </Col>
       </Row>
     </Container>
@@ -18,12 +18,11 @@ function DashboardPage() {
         setCoursesCompleted(gpaData.completed_units);
         setGpa(gpaData.current_gpa.toFixed(2));
 
-        // Fetch study time from /api/sessions
-        const sessionsRes = await fetch('http://localhost:5000/api/sessions');
+        // Fetch study time totals (summed on the server) from /api/sessions
+        const sessionsRes = await fetch('http://localhost:5000/api/sessions?group_by=course');
         if (!sessionsRes.ok) throw new Error(`Failed to fetch sessions: ${sessionsRes.status}`);
         const sessionsData = await sessionsRes.json();
-        const totalStudyTime = sessionsData.sessions.reduce((sum, s) => sum + s.duration_minutes, 0) || 0;
-        setStudyTime(totalStudyTime);
+        setStudyTime(sessionsData.total.duration_minutes || 0);
       } catch (error) {
         console.error('Error fetching dashboard data:', error);
       }
@@ -12,6 +12,7 @@ function PracticePage() {
   const [items, setItems] = useState([]);
   const [error, setError] = useState(null);
   const [loading, setLoading] = useState(false); // New loading state
+  const [notice, setNotice] = useState(null);
 
   useEffect(() => {
     fetch('http://localhost:5000/api/courses')
@@ -44,18 +45,44 @@ function PracticePage() {
   const handleGenerate = async (e) => {
     e.preventDefault();
     setError(null);
+    setNotice(null);
     setItems([]);
     setLoading(true); // Set loading to true
     try {
-      const response = await fetch('http://localhost:5000/api/generate_practice', {
+      // Items arrive one by one over Server-Sent Events as the AI writes them
+      const response = await fetch('http://localhost:5000/api/generate_practice/stream', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ course_id: selectedCourseId, type: practiceType, num_items: numItems, content, question_type: questionType }),
       });
       if (!response.ok) throw new Error('Failed to generate practice');
-      const data = await response.json();
-      if (data.items[0].error) setError(data.items[0].error);
-      else setItems(data.items.map(item => ({ ...item, userAnswer: '', showAnswer: false, isCorrect: null, feedback: '' })));
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let done = false;
+      while (!done) {
+        const { value, done: streamDone } = await reader.read();
+        if (streamDone) break;
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+        for (const rawEvent of events) {
+          const event = rawEvent.match(/^event: (.*)$/m)?.[1];
+          const data = JSON.parse(rawEvent.match(/^data: (.*)$/m)?.[1] || '{}');
+          if (event === 'item') {
+            if (data.error) setError(data.error);
+            else setItems(prev => [...prev, { ...data, userAnswer: '', showAnswer: false, isCorrect: null, feedback: '' }]);
+          } else if (event === 'error') {
+            setError(data.error);
+          } else if (event === 'done') {
+            done = true;
+            if (data.missing > 0) {
+              setNotice(`${data.missing} of ${numItems} items were left out: they repeated questions you already have.`);
+            }
+          }
+        }
+      }
     } catch (err) {
       setError(err.message);
     } finally {
@@ -63,6 +90,46 @@ function PracticePage() {
     }
   };
 
+  const handleLoadDue = async () => {
+    setError(null);
+    setNotice(null);
+    setItems([]);
+    setLoading(true);
+    try {
+      // Saved questions whose review is due, most overdue first; each keeps its own question type
+      const params = new URLSearchParams({ limit: numItems });
+      if (selectedCourseId) params.append('course_id', selectedCourseId);
+      const response = await fetch(`http://localhost:5000/api/practice/due?${params.toString()}`);
+      if (!response.ok) throw new Error('Failed to fetch due questions');
+      const data = await response.json();
+      setPracticeType('exam');
+      setItems(data.questions.map(q => ({
+        id: q.id,
+        question: q.question_text,
+        answer: q.correct_answer,
+        working: q.working,
+        choices: q.choices,
+        numerical_answer: q.numerical_answer,
+        tolerance: q.tolerance,
+        questionType: q.question_type,
+        userAnswer: '', showAnswer: false, isCorrect: null, feedback: ''
+      })));
+      if (data.questions.length === 0) {
+        // Review times are stored in UTC without an offset
+        setNotice(data.next_due_at
+          ? `Nothing is due. Next review: ${new Date(data.next_due_at + 'Z').toLocaleString()}`
+          : 'No saved questions to review yet.');
+      }
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  // Due questions carry their own type; generated ones use the selected question type
+  const typeOf = (item) => item.questionType || questionType;
+
   const handleAnswerChange = (index, value) => {
     const newItems = [...items];
     newItems[index].userAnswer = value;
@@ -76,13 +143,13 @@ function PracticePage() {
     let feedback = '';
 
     if (practiceType === 'exam') {
-      if (questionType === 'free_text') {
+      if (typeOf(item) === 'free_text') {
         correct = item.userAnswer.toLowerCase().trim() === item.answer.toLowerCase().trim();
         feedback = correct ? 'Correct!' : 'Incorrect.';
-      } else if (questionType === 'multiple_choice') {
+      } else if (typeOf(item) === 'multiple_choice') {
         correct = item.userAnswer === item.answer;
         feedback = correct ? 'Correct!' : 'Incorrect.';
-      } else if (questionType === 'numerical') {
+      } else if (typeOf(item) === 'numerical') {
         const userAnswerNum = parseFloat(item.userAnswer);
         const numericalAnswerNum = parseFloat(item.numerical_answer);
         const tolerance = parseFloat(item.tolerance || 0);
@@ -155,7 +222,7 @@ function PracticePage() {
           <Col md={4}>
             <Form.Group className="mb-3">
               <Form.Label>Number of Items</Form.Label>
-              <Form.Control type="number" value={numItems} onChange={(e) => setNumItems(e.target.value)} min="1" max="10" />
+              <Form.Control type="number" value={numItems} onChange={(e) => setNumItems(e.target.value)} min="1" max="100" />
             </Form.Group>
           </Col>
         </Row>
@@ -178,9 +245,13 @@ function PracticePage() {
         <Button variant="primary" type="submit" disabled={loading}>
           {loading ? 'Generating...' : 'Generate'}
         </Button>
+        <Button variant="secondary" className="ms-2" onClick={handleLoadDue} disabled={loading}>
+          Review due questions
+        </Button>
       </Form>
       {loading && <p>Loading...</p>}
       {error && <Alert variant="danger" className="mt-3">Error: {error}</Alert>}
+      {notice && <Alert variant="info" className="mt-3">{notice}</Alert>}
       {items.length > 0 && (
         <Card className="mt-4">
           <Card.Header>{practiceType === 'exam' ? 'Exam Questions' : 'Flashcards'}</Card.Header>
@@ -199,7 +270,7 @@ function PracticePage() {
                     <td>
                       {practiceType === 'exam' ? (
                         <>
-                          {questionType === 'free_text' && (
+                          {typeOf(item) === 'free_text' && (
                             <Form.Control
                               type="text"
                               value={item.userAnswer}
@@ -208,7 +279,7 @@ function PracticePage() {
                               isValid={item.isCorrect === true}
                             />
                           )}
-                          {questionType === 'multiple_choice' && (
+                          {typeOf(item) === 'multiple_choice' && (
                             <div className="mt-2">
                               {item.choices && item.choices.map((choice, choiceIndex) => (
                                 <Form.Check
@@ -226,7 +297,7 @@ function PracticePage() {
                               ))}
                             </div>
                           )}
-                          {questionType === 'numerical' && (
+                          {typeOf(item) === 'numerical' && (
                             <Form.Control
                               type="number"
                               value={item.userAnswer}
@@ -1,11 +1,17 @@
 import React, { useState, useEffect } from 'react';
-import { Container, Row, Col, Form, Card, Table } from 'react-bootstrap';
+import { Container, Row, Col, Form, Card, Table, Button } from 'react-bootstrap';
+
+const PAGE_SIZE = 50;
 
 function SavedQuestionsPage() {
   const [courses, setCourses] = useState([]);
   const [selectedCourseId, setSelectedCourseId] = useState('');
+  const [searchInput, setSearchInput] = useState('');
+  const [searchQuery, setSearchQuery] = useState('');
   const [savedQuestions, setSavedQuestions] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState(null);
 
   useEffect(() => {
@@ -16,19 +22,28 @@ function SavedQuestionsPage() {
       .catch(err => console.error('Error fetching courses:', err));
   }, []);
 
+  const fetchSavedQuestionsPage = async (cursor) => {
+    // With a search query, pages come ranked from the full-text search endpoint
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (searchQuery) params.append('q', searchQuery);
+    if (selectedCourseId) params.append('course_id', selectedCourseId);
+    if (cursor) params.append('cursor', cursor);
+    const endpoint = searchQuery ? 'questions/search' : 'get_saved_questions';
+    const response = await fetch(`http://localhost:5000/api/${endpoint}?${params.toString()}`);
+    if (!response.ok) throw new Error('Failed to fetch saved questions');
+    const data = await response.json();
+    return { questions: searchQuery ? data.results : data.saved_questions, next_cursor: data.next_cursor };
+  };
+
   useEffect(() => {
-    // Fetch saved questions whenever selectedCourseId changes
+    // Fetch the first page of saved questions whenever selectedCourseId or searchQuery changes
     const fetchSavedQuestions = async () => {
       setLoading(true);
       setError(null);
       try {
-        const url = selectedCourseId 
-          ? `http://localhost:5000/api/get_saved_questions?course_id=${selectedCourseId}`
-          : 'http://localhost:5000/api/get_saved_questions';
-        const response = await fetch(url);
-        if (!response.ok) throw new Error('Failed to fetch saved questions');
-        const data = await response.json();
-        setSavedQuestions(data.saved_questions);
+        const data = await fetchSavedQuestionsPage(null);
+        setSavedQuestions(data.questions);
+        setNextCursor(data.next_cursor);
       } catch (err) {
         setError(err.message);
       } finally {
@@ -37,7 +52,22 @@ function SavedQuestionsPage() {
     };
 
     fetchSavedQuestions();
-  }, [selectedCourseId]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [selectedCourseId, searchQuery]);
+
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    setError(null);
+    try {
+      const data = await fetchSavedQuestionsPage(nextCursor);
+      setSavedQuestions(prev => [...prev, ...data.questions]);
+      setNextCursor(data.next_cursor);
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   return (
     <Container>
@@ -54,6 +84,25 @@ function SavedQuestionsPage() {
             </Form.Select>
           </Form.Group>
         </Col>
+        <Col md={6}>
+          <Form onSubmit={(e) => { e.preventDefault(); setSearchQuery(searchInput.trim()); }}>
+            <Form.Label>Search questions, answers and working</Form.Label>
+            <div className="d-flex">
+              <Form.Control
+                type="search"
+                value={searchInput}
+                placeholder='e.g. gradient descent -stochastic'
+                onChange={(e) => setSearchInput(e.target.value)}
+              />
+              <Button type="submit" variant="primary" className="ms-2">Search</Button>
+              {searchQuery && (
+                <Button variant="secondary" className="ms-2" onClick={() => { setSearchInput(''); setSearchQuery(''); }}>
+                  Clear
+                </Button>
+              )}
+            </div>
+          </Form>
+        </Col>
       </Row>
 
       {loading && <p>Loading saved questions...</p>}
@@ -72,6 +121,7 @@ function SavedQuestionsPage() {
                 <tr>
                   <th>Course</th>
                   <th>Question Type</th>
+                  {searchQuery && <th>Match</th>}
                   <th>Question</th>
                   <th>Correct Answer</th>
                   <th>Working</th>
@@ -79,10 +129,12 @@ function SavedQuestionsPage() {
                 </tr>
               </thead>
               <tbody>
-                {savedQuestions.map((q, index) => (
-                  <tr key={index}>
+                {savedQuestions.map((q) => (
+                  <tr key={q.id}>
                     <td>{q.course_code} - {q.course_name}</td>
                     <td>{q.question_type}</td>
+                    {/* The snippet is HTML-escaped by the backend, with matches wrapped in <mark> */}
+                    {searchQuery && <td dangerouslySetInnerHTML={{ __html: q.snippet }} />}
                     <td>{q.question_text}</td>
                     <td>
                       {q.correct_answer}
@@ -115,6 +167,11 @@ function SavedQuestionsPage() {
                 ))}
               </tbody>
             </Table>
+            {nextCursor && (
+              <Button variant="secondary" onClick={handleLoadMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </Button>
+            )}
           </Card.Body>
         </Card>
       )}
@@ -103,7 +103,21 @@ function SettingsPage() {
 
   const handleImportData = async () => {
     if (!importFile) {
-      alert('Please select a JSON file to import.');
+      alert('Please select a JSON or NDJSON file to import.');
+      return;
+    }
+    // NDJSON backups (optionally gzipped) are streamed to the server as-is
+    if (importFile.name.endsWith('.ndjson') || importFile.name.endsWith('.ndjson.gz')) {
+      try {
+        const contentType = importFile.name.endsWith('.gz') ? 'application/gzip' : 'application/x-ndjson';
+        const response = await axios.post('http://localhost:5000/api/import_data', importFile, {
+          headers: { 'Content-Type': contentType },
+        });
+        alert(`${response.data.message} (${response.data.total_rows} rows)`);
+        window.location.reload();
+      } catch (error) {
+        alert(`Error importing data: ${error.message}`);
+      }
       return;
     }
     const reader = new FileReader();
@@ -247,7 +261,7 @@ function SettingsPage() {
               <br />
               <input
                 type="file"
-                accept=".json"
+                accept=".json,.ndjson,.gz"
                 onChange={handleFileChange}
                 style={{ display: 'none' }} // Hide the input
                 ref={fileInputRef}
@@ -163,21 +163,18 @@ function LogSessionForm({ courses, onSessionLogged }) {
     );
 }
 
-function StudyTimeChart({ sessions }) {
+function StudyTimeChart({ courseTotals }) {
     const [chartData, setChartData] = useState(null);
 
     useEffect(() => {
-        if (!sessions || sessions.length === 0) return;
-
-        const timePerCourse = sessions.reduce((acc, session) => {
-            const code = session.course_code || "Uncategorized";
-            const netTime = session.duration_minutes - (session.break_duration || 0);
-            acc[code] = (acc[code] || 0) + netTime;
-            return acc;
-        }, {});
+        if (!courseTotals || courseTotals.length === 0) {
+            setChartData(null);
+            return;
+        }
 
-        const labels = Object.keys(timePerCourse);
-        const data = Object.values(timePerCourse);
+        // Net minutes per course are summed by the server (/api/sessions?group_by=course)
+        const labels = courseTotals.map(total => total.course_code || "Uncategorized");
+        const data = courseTotals.map(total => total.net_minutes);
 
         setChartData({
             labels: labels,
@@ -203,7 +200,7 @@ function StudyTimeChart({ sessions }) {
                 borderWidth: 1,
             }]
         });
-    }, [sessions]);
+    }, [courseTotals]);
 
     if (!chartData) {
         return <p className="text-center mt-4">Log some study sessions to see your distribution!</p>;
@@ -230,8 +227,13 @@ function StudyTimeChart({ sessions }) {
     );
 }
 
+const SESSIONS_PAGE_SIZE = 50;
+
 function StudyTrackerPage() {
     const [sessions, setSessions] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [courseTotals, setCourseTotals] = useState([]);
     const [courses, setCourses] = useState([]);
     const [editSession, setEditSession] = useState(null);
     const [showEditModal, setShowEditModal] = useState(false);
@@ -252,23 +254,45 @@ function StudyTrackerPage() {
             if (parsedCourses.length === 0) console.warn('No courses fetched');
             setCourses(parsedCourses);
 
-            const sessionsRes = await fetch('http://localhost:5000/api/sessions');
+            const sessionsRes = await fetch(`http://localhost:5000/api/sessions?limit=${SESSIONS_PAGE_SIZE}`);
             console.log('Sessions fetch status:', sessionsRes.status);
             if (!sessionsRes.ok) {
                 console.warn(`Sessions fetch failed: ${sessionsRes.status}, ${await sessionsRes.text()}`);
                 setSessions([]);
+                setNextCursor(null);
             } else {
                 const sessionsData = await sessionsRes.json();
-                console.log('Fetched sessions response:', JSON.stringify(sessionsData, null, 2));
                 const parsedSessions = sessionsData.sessions || [];
-                console.log('Parsed sessions:', parsedSessions);
                 if (parsedSessions.length === 0) console.warn('No sessions fetched');
                 setSessions(parsedSessions);
+                setNextCursor(sessionsData.next_cursor);
             }
+
+            const totalsRes = await fetch('http://localhost:5000/api/sessions?group_by=course');
+            if (!totalsRes.ok) throw new Error(`Failed to fetch study totals: ${totalsRes.status}`);
+            const totalsData = await totalsRes.json();
+            setCourseTotals(totalsData.totals || []);
         } catch (error) {
             console.error('Error fetching data:', error);
             setCourses([]);
             setSessions([]);
+            setCourseTotals([]);
+        }
+    };
+
+    const handleLoadMore = async () => {
+        setLoadingMore(true);
+        try {
+            const params = new URLSearchParams({ limit: SESSIONS_PAGE_SIZE, cursor: nextCursor });
+            const response = await fetch(`http://localhost:5000/api/sessions?${params.toString()}`);
+            if (!response.ok) throw new Error(`Failed to fetch sessions: ${response.status}`);
+            const data = await response.json();
+            setSessions(prev => [...prev, ...data.sessions]);
+            setNextCursor(data.next_cursor);
+        } catch (error) {
+            console.error('Error loading more sessions:', error);
+        } finally {
+            setLoadingMore(false);
         }
     };
 
@@ -358,7 +382,7 @@ function StudyTrackerPage() {
             <Row>
                 <Col md={5}>
                     <LogSessionForm courses={courses} onSessionLogged={fetchData} />
-                    <StudyTimeChart sessions={sessions} />
+                    <StudyTimeChart courseTotals={courseTotals} />
                     {selectedCourseId && (
                         <Card bg="dark" text="white" className="mt-4">
                             <Card.Header as="h4">Course Breakdown for {courses.find(c => c.id === selectedCourseId)?.code}</Card.Header>
@@ -438,6 +462,13 @@ function StudyTrackerPage() {
                             )}
                         </tbody>
                     </Table>
+                    {nextCursor && (
+                        <div className="text-center mb-3">
+                            <Button variant="secondary" onClick={handleLoadMore} disabled={loadingMore}>
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </Button>
+                        </div>
+                    )}
                     <Modal show={showEditModal} onHide={handleCloseModals} centered>
                         <Modal.Header closeButton>
                             <Modal.Title>Edit Study Session</Modal.Title>